@@ -0,0 +1,233 @@
+"""
+Load the navbar with many concurrent sessions in a single process.
+
+Each session runs an example app with the script runner of ``AppTest``,
+rerun in its own thread, and all of them start at the same time. Unlike
+``AppTest``, which replaces the Streamlit runtime on every run and so can
+not run in parallel, the sessions share a single mock runtime, and each one
+keeps its pages manager between reruns, like a real session. For a growing
+number of sessions, it reports the reruns per second of the process, the
+p50 and p99 latency of the ``st_navbar`` calls, and the resident memory of
+the process.
+
+It also looks for bugs that only show up with concurrent sessions: every
+run must succeed and render the same page as the first session, and the
+class attributes of Streamlit's ``PagesManager``, which are shared by all
+sessions, must not be set by the navbar. Since the examples import their own
+``pages`` modules, only one example is loaded per process.
+
+Run it from the root of the repository::
+
+    python benchmarks/load.py
+    python benchmarks/load.py examples/st_navbar_3/streamlit_app.py --sessions 1 8 64
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+from unittest.mock import MagicMock
+
+from streamlit.runtime import Runtime
+from streamlit.runtime.caching.storage.dummy_cache_storage import (
+    MemoryCacheStorageManager,
+)
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.pages_manager import PagesManager
+from streamlit.runtime.state import SafeSessionState, SessionState
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+import streamlit_navigation_bar
+
+
+DEFAULT_APP = "examples/st_navbar_1/streamlit_app.py"
+SESSIONS = [1, 8, 32, 128]
+RERUNS = 10
+
+# The attributes that Streamlit itself sets on the class, once per process.
+STREAMLIT_ATTRIBUTES = {"DefaultStrategy"}
+
+
+def rss_mib():
+    """Get the resident memory of the process, in MiB."""
+    try:
+        with open("/proc/self/statm") as file:
+            pages = int(file.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        import resource
+
+        # The peak instead of the current memory, in KiB on Linux and bytes
+        # on macOS.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+class TimedNavbar:
+    """Wrap ``st_navbar`` to record the latency of each call."""
+
+    def __init__(self, st_navbar):
+        self.st_navbar = st_navbar
+        self.latencies = []
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.st_navbar(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.latencies.append(elapsed)
+
+
+class Session:
+    """Simulate a session of an app, which runs its script in the process."""
+
+    def __init__(self, app_path):
+        self.app_path = app_path
+        self.session_state = SafeSessionState(SessionState(), lambda: None)
+        self.pages_manager = PagesManager(app_path, setup_watcher=False)
+
+    def run(self, timeout=30):
+        """Run the script, returning the element tree that it rendered."""
+        script_runner = LocalScriptRunner(
+            self.app_path, self.session_state, self.pages_manager
+        )
+        return script_runner.run(None, {}, timeout)
+
+
+def mock_runtime():
+    """Create the runtime shared by the sessions, like ``AppTest`` does."""
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    return runtime
+
+
+def run_session(app_path, reruns, barrier, outputs, errors):
+    session = Session(app_path)
+    barrier.wait()
+    for _ in range(reruns):
+        try:
+            tree = session.run()
+        except Exception as error:
+            errors.append(repr(error))
+            return
+        if tree.exception:
+            errors.append(tree.exception[0].message)
+            return
+        outputs.append(tuple(element.value for element in tree.markdown))
+
+
+def run_load(app_path, sessions, reruns):
+    """Run `sessions` concurrent sessions, returning the load statistics."""
+    timed = streamlit_navigation_bar.st_navbar = TimedNavbar(
+        streamlit_navigation_bar.st_navbar.st_navbar
+        if isinstance(streamlit_navigation_bar.st_navbar, TimedNavbar)
+        else streamlit_navigation_bar.st_navbar
+    )
+    barrier = threading.Barrier(sessions)
+    outputs = []
+    errors = []
+    threads = [
+        threading.Thread(
+            target=run_session,
+            args=(app_path, reruns, barrier, outputs, errors),
+        )
+        for _ in range(sessions)
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = timed.latencies
+    return {
+        "sessions": sessions,
+        "reruns_per_s": len(outputs) / elapsed,
+        "p50_ms": percentile(latencies, 0.5) * 1000 if latencies else None,
+        "p99_ms": percentile(latencies, 0.99) * 1000 if latencies else None,
+        "rss_mib": rss_mib(),
+        "outputs": outputs,
+        "errors": errors,
+    }
+
+
+def find_problems(result, expected_output, class_attributes):
+    """Get the shared-state bugs found in the results of a load."""
+    problems = [f"run failed: {error}" for error in result["errors"]]
+    for output in set(result["outputs"]):
+        if output != expected_output:
+            problems.append(f"run rendered {output}, not {expected_output}")
+
+    # Anything that the navbar sets on the class of Streamlit's pages
+    # manager is shared by every session of the process.
+    changed = {
+        name
+        for name, value in vars(PagesManager).items()
+        if name not in STREAMLIT_ATTRIBUTES
+        and (name not in class_attributes or class_attributes[name] is not value)
+    }
+    for name in sorted(changed):
+        problems.append(f"PagesManager.{name} was set by a session")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("app", nargs="?", default=DEFAULT_APP, help="app to load")
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        nargs="+",
+        default=SESSIONS,
+        help="numbers of concurrent sessions",
+    )
+    parser.add_argument(
+        "--reruns", type=int, default=RERUNS, help="reruns of each session"
+    )
+    args = parser.parse_args(argv)
+
+    class_attributes = dict(vars(PagesManager))
+    Runtime._instance = mock_runtime()
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.app)))
+
+    # A first session loads the imports and the caches of the process, and
+    # renders the output that every other run must render too.
+    first = run_load(args.app, 1, 1)
+    if first["errors"]:
+        print(f"The app failed: {first['errors'][0]}")
+        return 1
+    expected_output = first["outputs"][0]
+
+    print(f"{'sessions':>8} {'reruns/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'RSS MiB':>8}")
+    problems = []
+    for sessions in args.sessions:
+        result = run_load(args.app, sessions, args.reruns)
+        print(
+            f"{result['sessions']:>8} {result['reruns_per_s']:>9.1f} "
+            f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} "
+            f"{result['rss_mib']:>8.1f}",
+            flush=True,
+        )
+        problems.extend(find_problems(result, expected_output, class_attributes))
+
+    for problem in dict.fromkeys(problems):
+        print(f"PROBLEM {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+Benchmark the page lookups of ``st_navbar`` against the number of pages.
+
+Each scenario runs a navbar of 10 to 5000 pages in a session of ``AppTest``,
+with the last page selected, which is the slowest one to find by scanning
+the pages. It is run once with the ``PageRegistry`` that ``st_navbar`` uses,
+and once with a registry that scans its lists for every lookup, as the
+navbar did before it was indexed. Only the call to ``st_navbar`` is
+measured, inside the script, on the first run, which prepares the navbar,
+and on the reruns. The times are the fastest of a few sessions.
+
+Run it from the root of the repository::
+
+    python benchmarks/page_registry.py
+"""
+
+import statistics
+from unittest import mock
+
+from streamlit.errors import StreamlitAPIException
+from streamlit.testing.v1 import AppTest
+
+from streamlit_navigation_bar.page_registry import PageRegistry
+
+
+SIZES = [10, 100, 1000, 5000]
+RERUNS = 10
+# The sessions in which the times of a scenario are measured, taking the
+# fastest one, since a single first run is too noisy.
+ROUNDS = 3
+
+
+class ScanRegistry(PageRegistry):
+    """A registry that scans the pages for every lookup, for comparison."""
+
+    def __contains__(self, item):
+        return item in self.pages
+
+    def add(self, page):
+        if any(p._script_hash == page._script_hash for p in self.page_objects):
+            raise StreamlitAPIException(
+                f"Multiple Pages specified with URL pathname {page.url_path}."
+            )
+        self.page_objects.append(page)
+
+    def by_url_path(self, url_path):
+        return next((p for p in self.page_objects if p.url_path == url_path), None)
+
+    def by_title(self, title):
+        return next((p for p in self.page_objects if p.title == title), None)
+
+    def by_key(self, key):
+        key = key.lower()
+        return next((p for p in self.page_objects if p.url_path.lower() == key), None)
+
+    def by_hash(self, page_script_hash):
+        return next(
+            (p for p in self.page_objects if p._script_hash == page_script_hash),
+            None,
+        )
+
+
+def app(size):
+    import time
+
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    pages = [f"Page {i}" for i in range(size)]
+    start = time.perf_counter()
+    st_navbar(pages, selected=pages[-1], adjust=False, key="nav")
+    elapsed = time.perf_counter() - start
+    st.session_state.setdefault("times", []).append(elapsed)
+
+
+def run_scenario(size, registry):
+    """Run a scenario in a new session, returning the times of its runs."""
+    at = AppTest.from_function(app, kwargs={"size": size})
+    with mock.patch("streamlit_navigation_bar.PageRegistry", registry):
+        for _ in range(RERUNS + 1):
+            at.run(timeout=60)
+            if at.exception:
+                raise RuntimeError(at.exception[0].message)
+    return at.session_state["times"]
+
+
+def measure(size, registry):
+    rounds = [run_scenario(size, registry) for _ in range(ROUNDS)]
+    return (
+        min(times[0] for times in rounds) * 1000,
+        min(statistics.median(times[1:]) for times in rounds) * 1000,
+    )
+
+
+def main():
+    # The imports and the caches of the process are loaded once, so they are
+    # not measured as the first run of a scenario.
+    run_scenario(10, PageRegistry)
+
+    print(
+        f"{'pages':>6} {'lookup':>8} {'first (ms)':>11} {'rerun (ms)':>11}",
+        flush=True,
+    )
+    for size in SIZES:
+        for name, registry in [("scan", ScanRegistry), ("registry", PageRegistry)]:
+            first, rerun = measure(size, registry)
+            print(f"{size:>6} {name:>8} {first:>11.2f} {rerun:>11.3f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark the bytes of the navbar component sent to the browser per rerun.
+
+A navbar with a logo, icons and styles is run a few times in a session, with
+and without a key. With a key, the heavy arguments are only sent in full on
+the first run, and the following reruns send their hashes instead.
+
+Run it from the root of the repository::
+
+    python benchmarks/payload_bytes.py
+"""
+
+import os
+
+from streamlit.testing.v1 import AppTest
+
+
+RERUNS = 5
+LOGO_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "examples",
+    "st_navbar_10",
+    "cubes.svg",
+)
+
+
+def app(key, logo_path):
+    from streamlit_navigation_bar import st_navbar
+
+    pages = [f"Page {i}" for i in range(20)]
+    st_navbar(
+        pages,
+        right=["GitHub"],
+        logo_path=logo_path,
+        icons={page: ":material/home:" for page in pages},
+        styles={
+            "nav": {"background-color": "royalblue", "height": "3rem"},
+            "span": {"color": "white", "padding": "14px"},
+            "active": {"background-color": "white", "color": "royalblue"},
+            "hover": {"background-color": "rgba(255, 255, 255, 0.35)"},
+        },
+        key=key,
+    )
+
+
+def measure(key):
+    """Get the size of the component element of each run, in bytes."""
+    at = AppTest.from_function(app, kwargs={"key": key, "logo_path": LOGO_PATH})
+    sizes = []
+    for _ in range(RERUNS):
+        at.run()
+        sizes.append(at.get("component_instance")[0].proto.ByteSize())
+    return sizes
+
+
+def main():
+    print(f"{'key':>6} " + " ".join(f"{f'run {i}':>7}" for i in range(RERUNS)))
+    for key in [None, "nav"]:
+        sizes = measure(key)
+        print(f"{str(key):>6} " + " ".join(f"{size:>7}" for size in sizes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Benchmark the Python cost of ``st_navbar`` per rerun, headless.
+
+Each scenario runs a synthetic navbar in a session of ``AppTest``, with 10,
+100 or 1000 pages, plain or with a logo, styles and icons, and with or
+without the CSS adjustments. Only the call to ``st_navbar`` is measured,
+inside the script, for its wall time and the peak of memory that it
+allocates, on the first run, which prepares the navbar, and on the reruns.
+The times are the fastest of a few sessions.
+
+The results can be saved to a JSON baseline, and compared against it later,
+which flags the metrics that got worse by more than a threshold and exits
+with an error.
+
+Run it from the root of the repository::
+
+    python benchmarks/reruns.py --save benchmarks/baseline.json
+    python benchmarks/reruns.py --compare benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+
+SIZES = [10, 100, 1000]
+RERUNS = 10
+# The sessions in which the times of a scenario are measured, taking the
+# fastest one, since a single first run is too noisy.
+ROUNDS = 5
+THRESHOLD = 0.25
+# The smallest change flagged as a regression, by the unit of the metric,
+# since the timer and the allocations are noisy for tiny values.
+MIN_DELTA = {"ms": 0.5, "kib": 1.0}
+LOGO_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "examples",
+    "st_navbar_10",
+    "cubes.svg",
+)
+
+
+def app(size, styled, adjust, trace, logo_path):
+    import time
+    import tracemalloc
+
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    pages = [f"Page {i}" for i in range(size)]
+    kwargs = {}
+    if styled:
+        kwargs = {
+            "logo_path": logo_path,
+            "icons": {page: ":material/home:" for page in pages},
+            "styles": {
+                "nav": {"background-color": "royalblue"},
+                "span": {"color": "white", "padding": "14px"},
+                "active": {"background-color": "white", "color": "royalblue"},
+                "hover": {"background-color": "rgba(255, 255, 255, 0.35)"},
+            },
+        }
+
+    if trace:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    st_navbar(pages, adjust=adjust, key="nav", **kwargs)
+    elapsed = time.perf_counter() - start
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1] - before
+        st.session_state.setdefault("peaks", []).append(peak)
+    st.session_state.setdefault("times", []).append(elapsed)
+
+
+def run_scenario(size, styled, adjust, trace):
+    """Run a scenario in a new session, returning the state of its runs."""
+    at = AppTest.from_function(
+        app,
+        kwargs={
+            "size": size,
+            "styled": styled,
+            "adjust": adjust,
+            "trace": trace,
+            "logo_path": LOGO_PATH,
+        },
+    )
+    for _ in range(RERUNS + 1):
+        at.run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    return at.session_state
+
+
+def measure(size, styled, adjust):
+    """Measure a scenario, with the times and the memory in separate runs."""
+    import tracemalloc
+
+    rounds = [
+        run_scenario(size, styled, adjust, trace=False)["times"] for _ in range(ROUNDS)
+    ]
+    tracemalloc.start()
+    try:
+        peaks = run_scenario(size, styled, adjust, trace=True)["peaks"]
+    finally:
+        tracemalloc.stop()
+    return {
+        "first_ms": round(min(times[0] for times in rounds) * 1000, 3),
+        "rerun_ms": round(
+            min(statistics.median(times[1:]) for times in rounds) * 1000, 3
+        ),
+        "first_peak_kib": round(peaks[0] / 1024, 1),
+        "rerun_peak_kib": round(statistics.median(peaks[1:]) / 1024, 1),
+    }
+
+
+def scenarios():
+    for size in SIZES:
+        for styled in [False, True]:
+            for adjust in [True, False]:
+                name = (
+                    f"{size}-pages"
+                    f"{'-styled' if styled else ''}"
+                    f"{'' if adjust else '-no-adjust'}"
+                )
+                yield name, size, styled, adjust
+
+
+def run_all():
+    # The imports and the caches of the process, such as the icon font, are
+    # loaded once, so they are not measured as the first run of a scenario.
+    run_scenario(10, styled=True, adjust=True, trace=False)
+
+    results = {}
+    for name, size, styled, adjust in scenarios():
+        results[name] = measure(size, styled, adjust)
+        print(
+            f"{name:<28} " + " ".join(f"{k}={v:<10}" for k, v in results[name].items()),
+            flush=True,
+        )
+    return {
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "reruns": RERUNS,
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold):
+    """Get the metrics that got worse than the baseline by over `threshold`."""
+    regressions = []
+    for name, metrics in current["results"].items():
+        old_metrics = baseline["results"].get(name)
+        if old_metrics is None:
+            continue
+        for metric, value in metrics.items():
+            old = old_metrics.get(metric)
+            min_delta = MIN_DELTA[metric.rsplit("_", 1)[1]]
+            if old is not None and value - old > max(old * threshold, min_delta):
+                regressions.append((name, metric, old, value))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--save", metavar="PATH", help="save the results")
+    parser.add_argument("--compare", metavar="PATH", help="compare to a baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help=f"relative change flagged as a regression (default: {THRESHOLD})",
+    )
+    args = parser.parse_args(argv)
+
+    current = run_all()
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(current, file, indent=2)
+            file.write("\n")
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(baseline, current, args.threshold)
+        for name, metric, old, new in regressions:
+            print(f"REGRESSION {name} {metric}: {old} -> {new}")
+        if regressions:
+            return 1
+        print(f"No regressions over {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
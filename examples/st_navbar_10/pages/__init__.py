@@ -1,15 +1 @@
-from pages.home import show_home
-from pages.install import show_install
-from pages.user_guide import show_user_guide
-from pages.api import show_api
-from pages.examples import show_examples
-from pages.community import show_community
-
-__all__ = [
-    "show_home",
-    "show_install",
-    "show_user_guide",
-    "show_api",
-    "show_examples",
-    "show_community",
-]
+# The page modules are imported lazily by the app, through PageRef.
@@ -1,19 +1,17 @@
 import os
 
 import streamlit as st
-from streamlit_navigation_bar import st_navbar
-
-import pages as pg
+from streamlit_navigation_bar import PageRef, st_navbar
 
 
 st.set_page_config(initial_sidebar_state="collapsed")
 
 pages = [
-    st.Page(pg.show_install, title="Install"),
-    st.Page(pg.show_user_guide, title="User Guide"),
-    st.Page(pg.show_api, title="API"),
-    st.Page(pg.show_examples, title="Examples"),
-    st.Page(pg.show_community, title="Community"),
+    st.Page(PageRef("pages.install:show_install"), title="Install"),
+    st.Page(PageRef("pages.user_guide:show_user_guide"), title="User Guide"),
+    st.Page(PageRef("pages.api:show_api"), title="API"),
+    st.Page(PageRef("pages.examples:show_examples"), title="Examples"),
+    st.Page(PageRef("pages.community:show_community"), title="Community"),
     "GitHub",
 ]
 
@@ -70,8 +68,9 @@ page = st_navbar(
     styles=styles,
     css=css,
     options=options,
+    warm_up=True,
 )
 if page == "Home":
-    pg.show_home()
+    PageRef("pages.home:show_home")()
 else:
     page.run()
@@ -1,11 +1,23 @@
+import runpy
 from pathlib import Path
 
 from setuptools import setup
+from setuptools.command.build_py import build_py
 
 
 this_directory = Path(__file__).parent
 long_description = (this_directory / "README.md").read_text()
 
+
+class BuildPy(build_py):
+    """Compile the CSS templates into a Python module, before the build."""
+
+    def run(self):
+        compiler = this_directory / "streamlit_navigation_bar/templates/compile.py"
+        runpy.run_path(str(compiler), run_name="__main__")
+        super().run()
+
+
 setup(
     name="streamlit-community-navigation-bar",
     description="A component that allows you to place a navigation bar in your Streamlit app.",
@@ -43,7 +55,7 @@ setup(
     packages=["streamlit_navigation_bar", "streamlit_community_navigation_bar"],
     include_package_data=True,
     package_data={
-        "streamlit_navigation_bar": ["templates/*.css"],
+        "streamlit_navigation_bar": ["templates/*.css", "fonts/*"],
     },
     entry_points={
         "console_scripts": [
@@ -51,10 +63,14 @@ setup(
         ]
     },
     python_requires=">=3.9",
-    setup_requires=["setuptools_scm"],
+    cmdclass={"build_py": BuildPy},
+    setup_requires=["setuptools_scm", "jinja2"],
     install_requires=[
         "streamlit > 1.38.0",
-        "st-theme >= 1.2.3",
     ],
+    extras_require={
+        # Subset the icon font to the icons used by the navbar.
+        "icons": ["fonttools[woff]"],
+    },
     use_scm_version=True,
 )
@@ -1,5 +1,10 @@
 import os
+import re
+import copy
+import threading
+import json
 import base64
+import hashlib
 from importlib.metadata import version as _version
 
 from typing import TYPE_CHECKING, Callable, Union
@@ -7,15 +12,56 @@ from typing import TYPE_CHECKING, Callable, Union
 from typing_extensions import TypeAlias
 
 from streamlit.navigation.page import StreamlitPage
+from streamlit import runtime
 import streamlit as st
 
 import streamlit.components.v1 as components
-from jinja2 import FileSystemLoader, Environment
 
 from pathlib import Path
+from streamlit_navigation_bar.compiled_css import render_options_css
+from streamlit_navigation_bar.icon_font import (
+    FONT_STYLESHEET,
+    font_ready,
+    icon_font,
+    icon_name,
+)
 from streamlit_navigation_bar.match_navbar import MatchNavbar
+from streamlit_navigation_bar.page_ref import PageRef, warm_up_pages
+from streamlit_navigation_bar.page_pool import (
+    is_placeholder,
+    placeholder_page,
+    reserve_placeholders,
+)
+from streamlit_navigation_bar.page_registry import PageRegistry
+from streamlit_navigation_bar.payload import (
+    NULL_SIZE,
+    PayloadSizes,
+    PayloadTotals,
+    html_size,
+    json_size,
+    payload_sizes,
+    payload_totals,
+    record_payload,
+)
+from streamlit_navigation_bar.prefetch import submit_prefetch
+from streamlit_navigation_bar.session_memo import (
+    SessionMemo,
+    SessionStore,
+    fingerprint,
+)
+from streamlit_navigation_bar.lru_cache import LRUCache
+from streamlit_navigation_bar.timing import (
+    ClientMeasure,
+    client_measures,
+    disable_timing,
+    enable_timing,
+    stage,
+    timed,
+    timing_stats,
+)
 from streamlit_navigation_bar.errors import (
     check_pages,
+    check_sections,
     check_selected,
     check_logo_path,
     check_logo_page,
@@ -23,11 +69,17 @@ from streamlit_navigation_bar.errors import (
     check_styles,
     check_options,
     check_adjust,
+    check_warm_up,
+    check_on_prefetch,
+    check_prefetch_delay,
+    check_click_window,
+    check_on_perf,
     check_key,
+    check_spec_args,
+    check_page_key,
 )
 
 # These are needed for setup_navigation
-from streamlit.runtime.pages_manager import PagesManager
 from streamlit.errors import StreamlitAPIException
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.proto.Navigation_pb2 import Navigation as NavigationProto
@@ -39,8 +91,27 @@ from streamlit.runtime.scriptrunner_utils.script_run_context import (
 if TYPE_CHECKING:
     from streamlit.source_util import PageHash, PageInfo
 
+__all__ = [
+    "ClientMeasure",
+    "NavbarSpec",
+    "PageRef",
+    "PayloadSizes",
+    "PayloadTotals",
+    "css_cache_info",
+    "disable_timing",
+    "enable_timing",
+    "memo_info",
+    "payload_sizes",
+    "payload_totals",
+    "print_version",
+    "st_navbar",
+    "timing_stats",
+]
+
 SectionHeader: TypeAlias = str
 PageType: TypeAlias = Union[str, Path, Callable[[], None], StreamlitPage]
+# The pages of a part of the navbar, in a list or by the header of their section.
+SectionedPages: TypeAlias = Union[list[PageType], dict[SectionHeader, list[PageType]]]
 
 _RELEASE = "STREAMLIT_COMMUNITY_DEVELOPMENT" not in os.environ
 
@@ -58,16 +129,246 @@ else:
     )
 
 
+# Prepared navbar states of each session, replayed on unchanged reruns.
+_memo = SessionMemo()
+
+# The hashes of the heavy component arguments sent to each session.
+_sent_args = SessionStore()
+
+# The id of the last batch of client performance measures of each session.
+_perf_batches = SessionStore()
+
+# The CSS rendered by `adjust_css`, shared by all sessions.
+_css_cache = LRUCache(maxsize=128)
+
+# The contents of each logo file, by its path, with the modification time and
+# size of when it was read.
+_logos = {}
+
+
 def print_version():
     """Show the installed version of the Streamlit Navigation Bar package."""
     version = _version("streamlit-navigation-bar")
     print(f"Streamlit Navigation Bar, version {version}")
 
 
-def _encode_svg(path):
-    """Encode an SVG to base64, from an absolute path."""
-    svg = open(path).read()
-    return base64.b64encode(svg.encode("utf-8")).decode("utf-8")
+def _file_signature(path):
+    """Get the modification time and size of a file, to detect changes."""
+    if not isinstance(path, str):
+        return None
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_svg(path):
+    """Read an SVG once per process, from an absolute path, until it changes."""
+    signature = _file_signature(path)
+    cached = _logos.get(path)
+    if cached is None or cached[0] != signature:
+        with open(path, "rb") as file:
+            cached = (signature, file.read())
+        _logos[path] = cached
+    return cached[1]
+
+
+def _encode_file(data):
+    """Encode the contents of a file to base64."""
+    return base64.b64encode(data).decode("utf-8")
+
+
+def _serve_file(data, base64_data, mimetype, key):
+    """
+    Serve the contents of a file as a media file and get its URL.
+
+    The URL is derived from a hash of the contents, so it stays the same
+    between reruns and sessions, and the browser can cache the file. The file
+    is added to the media file manager on every run, in order to keep it
+    referenced by the session, but it is only stored once.
+
+    When the component is served by the development server, or there is no
+    Streamlit runtime, the media files can not be reached by the component.
+    Then, no URL is returned and the file is sent encoded in base64 instead.
+
+    Parameters
+    ----------
+    data : bytes
+        The contents of the file.
+    base64_data : str
+        The contents of the file encoded in base64.
+    mimetype : str
+        The MIME type of the file.
+    key : str
+        The name of the file in the session, unique for each navbar.
+
+    Returns
+    -------
+    url : str or None
+        The URL of the media file, relative to the root of the app.
+    base64_data : str or None
+        The file encoded in base64, when there is no URL.
+    """
+    if not _RELEASE or not runtime.exists():
+        return None, base64_data
+
+    url = runtime.get_instance().media_file_mgr.add(data, mimetype, key)
+    return url, None
+
+
+def _content_hash(value):
+    """Hash a component argument by its JSON representation."""
+    data = json.dumps(value, separators=(",", ":")).encode("utf-8")
+    return hashlib.md5(data).hexdigest()
+
+
+def _address_args(values, hashes, sent):
+    """
+    Replace the component arguments already sent to a session by their hash.
+
+    Each argument is sent in full when its hash is not the last one sent for
+    the session, and omitted otherwise. The hashes are always sent, so the
+    frontend can take the omitted arguments from its cache.
+
+    Parameters
+    ----------
+    values : dict of {str : object}
+        The heavy arguments of the component, by their name.
+    hashes : dict of {str : str}
+        The content hash of each argument in `values`, by its name.
+    sent : dict of {str : str}
+        The hash of each argument last sent to the session, by its name. It
+        is updated with `hashes`.
+
+    Returns
+    -------
+    args : dict of {str : object}
+        The arguments to pass to the component.
+    """
+    args = {"hashes": hashes}
+    for name, value in values.items():
+        if sent.get(name) != hashes[name]:
+            args[name] = value
+    sent.update(hashes)
+    return args
+
+
+def _resend_callback(on_change, key, sent):
+    """
+    Wrap the `on_change` callback to handle the requests to resend arguments.
+
+    When the frontend lost an argument that was only sent by its hash, for
+    example because the message with it was dropped by an interrupted rerun,
+    it sets a value with a ``"resend"`` request in its third item. Then, the
+    hashes sent to the session are forgotten, and the user's callback is
+    skipped.
+    """
+
+    def callback():
+        value = st.session_state[key]
+        if len(value) > 2 and "resend" in value[2]:
+            sent.clear()
+        elif on_change is not None:
+            on_change()
+
+    return callback
+
+
+@st.fragment
+def _prefetch_listener(on_prefetch, channel, key):
+    """
+    Place the hidden instance of the component that listens to prefetch hints.
+
+    The navbar dispatches a hint when the pointer rests on a page, and this
+    instance sets it as its value. Since it is in a fragment, only the
+    fragment reruns, and the callback submits the `on_prefetch` hook to a
+    background thread pool.
+    """
+
+    def on_hint():
+        hint = st.session_state[key]
+        if hint:
+            submit_prefetch(on_prefetch, hint[0])
+
+    _st_navbar(listen=True, channel=channel, default=None, on_change=on_hint, key=key)
+
+
+def memo_info():
+    """
+    Get the statistics of the per-session fast path of ``st_navbar``.
+
+    A rerun that calls ``st_navbar`` with the same arguments as the previous
+    run of the session is a hit, and replays the prepared navbar. Otherwise,
+    it is a miss, and the arguments are validated and prepared again.
+
+    Returns
+    -------
+    info : MemoInfo
+        A named tuple with the ``hits`` and ``misses`` counters of the current
+        process, and the number of ``sessions`` with a remembered navbar.
+    """
+    return _memo.info()
+
+
+def css_cache_info():
+    """
+    Get the statistics of the cache with the CSS adjustments of the navbar.
+
+    The CSS rendered from the templates is kept in a process-wide cache, by
+    the values that it depends on. When the cache is full, the least recently
+    used CSS is evicted.
+
+    Returns
+    -------
+    info : CacheInfo
+        A named tuple with the ``hits``, ``misses``, ``evictions``,
+        ``maxsize`` and ``currsize`` fields.
+    """
+    return _css_cache.info()
+
+
+def _sections(pages: SectionedPages) -> list[tuple[SectionHeader, list[PageType]]]:
+    """
+    Split the pages of a part of the navbar into its sections.
+
+    Like ``st.navigation``, the pages can be given as a dictionary of section
+    headers and lists of pages, where the pages of the ``""`` header are not
+    in a section. A list of pages has no sections.
+
+    Returns
+    -------
+    sections : list of tuple of (str, list)
+        The header and the pages of each section, in order.
+    """
+    if isinstance(pages, dict):
+        return list(pages.items())
+    return [("", pages)]
+
+
+def _flat_pages(pages: SectionedPages) -> list[PageType]:
+    """Get the pages of a part of the navbar, without their sections."""
+    if isinstance(pages, dict):
+        return [page for section in pages.values() for page in section]
+    return pages
+
+
+def _group_items(items, sections):
+    """
+    Group the payloads of the pages by their sections.
+
+    Each section becomes an item with the ``"title"`` of its header and the
+    payloads of its pages in ``"items"``, which the frontend renders as a
+    dropdown. The pages that are not in a section stay in place.
+    """
+    items = iter(items)
+    grouped = []
+    for header, pages in sections:
+        section_items = [next(items) for _ in pages]
+        if header:
+            grouped.append(
+                {"title": header, "key": "#" + header, "items": section_items}
+            )
+        else:
+            grouped.extend(section_items)
+    return grouped
 
 
 def _prepare_urls(urls, pages):
@@ -115,19 +416,12 @@ def _prepare_options(options):
 
 def _adjust(css):
     """Apply a CSS adjustment."""
-    st.html("<style>" + css + "</style>")
-
-
-def get_path(directory):
-    """Get the abs path for a directory in the same location as this file."""
-    parent_dir = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(parent_dir, directory)
+    st.html(_style_html(css))
 
 
-def load_env(path):
-    """Load the Jinja environment from a given absolute path."""
-    loader = FileSystemLoader(path)
-    return Environment(loader=loader, trim_blocks=True, lstrip_blocks=True)
+def _style_html(css):
+    """Wrap CSS in the HTML of a style block."""
+    return "<style>" + css + "</style>"
 
 
 def position_body(key, use_padding):
@@ -158,6 +452,13 @@ def position_body(key, use_padding):
         either the ``"with"`` notation or by calling methods directly on the
         returned object.
     """
+    container = st.container()
+    container.html(_position_html(key, use_padding))
+    return container
+
+
+def _position_html(key, use_padding):
+    """Build the HTML of the container that adjusts the position of the body."""
     if use_padding:
         # The position of the body will be 6rem from the top.
         margin_bottom = "-4.875rem"
@@ -165,7 +466,7 @@ def position_body(key, use_padding):
         # The position of the body will be right below the navbar.
         margin_bottom = "-8rem"
 
-    html = f"""
+    return f"""
         <style>
             div[data-testid="stVerticalBlockBorderWrapper"]:has(
                 div[data-testid="stVerticalBlock"]
@@ -178,19 +479,17 @@ def position_body(key, use_padding):
         </style>
         <span class='{key}'></span>
         """
-    container = st.container()
-    container.html(html)
-    return container
 
 
-def adjust_css(styles, options, key, path):
+def adjust_css(styles, options, key):
     """
     Apply CSS adjustments to display the navbar correctly.
 
     By default, Streamlit limits the position of components in the web app to
-    a certain width and adds a padding to the top. This function renders Jinja
-    templates to adjust the CSS and display the navbar at the full width at the
-    top of the window, among other options that can be toggled on or off.
+    a certain width and adds a padding to the top. This function renders the
+    templates, compiled ahead of time into the ``compiled_css`` module, to
+    adjust the CSS and display the navbar at the full width at the top of the
+    window, among other options that can be toggled on or off.
 
     It also matches the style, theme and configuration between the navbar and
     Streamlit's User Interface (UI) elements, to make them look seamless.
@@ -225,11 +524,13 @@ def adjust_css(styles, options, key, path):
         A key associated with the container that adjusts the CSS. This needs to
         be unique since all styles will be applied to the container with this
         key.
-    path : str
-        The absolute path to the directory containing the Jinja templates with
-        the CSS adjustments.
+
+    Returns
+    -------
+    size : int
+        The size in bytes of the HTML added to the app.
     """
-    ui = MatchNavbar(styles, key)
+    ui = MatchNavbar(styles)
 
     ui.height = ui.get_value(
         css_property="height",
@@ -264,22 +565,480 @@ def adjust_css(styles, options, key, path):
     margin = options["show_menu"] or options["show_sidebar"]
     key = f"st_navbar_key_{key}"
 
-    env = load_env(path)
-    template = env.get_template("options.css")
-    css = template.render(
-        ui=ui,
-        options=options,
-        margin=margin,
-        key=key,
+    # The CSS only depends on these values, so it is rendered once for them.
+    theme = ui.theme or {}
+    values = (
+        ui.height,
+        ui.hover_bg_color,
+        ui.color,
+        ui.bg_color,
+        ui.hover_color,
+        theme.get("backgroundColor"),
+        tuple(options.items()),
+        key,
     )
+    css = _css_cache.get(values)
+    if css is None:
+        css = render_options_css(
+            ui=ui,
+            options=options,
+            margin=margin,
+            key=key,
+        )
+        _css_cache.put(values, css)
+
     with position_body(key, options["use_padding"]):
         _adjust(css)
 
+    return html_size(_position_html(key, options["use_padding"])) + html_size(
+        _style_html(css)
+    )
+
 
 # A placeholder object to implement the default rules for `selected`.
 sentinel = object()
 
 
+class _FrozenDict(dict):
+    """A dict that can not be changed, and is still serialized as JSON."""
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("The dicts of a NavbarSpec can not be changed")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+def _freeze(value):
+    """Convert the dicts and lists in `value` to ones that can not change."""
+    # Only plain containers, since named tuples, like a PageRef, are values.
+    if type(value) is dict:
+        return _FrozenDict((k, _freeze(v)) for k, v in value.items())
+    if type(value) in (list, tuple):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class NavbarSpec:
+    """
+    Represent a validated and prepared navbar, which can not be changed.
+
+    It holds everything in the navbar that only depends on its arguments: the
+    payloads sent to the component, the logo, the pages registered in the app
+    and the navigation messages. ``st_navbar`` then only does the work of
+    each session, which is to look up deep links, read the selected page and
+    enqueue the navigation.
+
+    A spec can be built once, at the import of a module or in a function
+    decorated with ``st.cache_resource``, and shared by all sessions with
+    ``st_navbar(spec, key=...)``. When ``st_navbar`` is called with a list
+    of pages, it builds a spec for the session, and replays it on the reruns
+    with the same arguments.
+
+    Its lists are stored as tuples, and its dicts can not be changed either.
+    The page objects given to a spec are shared too, so ``st_navbar``
+    returns a copy of the selected one to each session.
+
+    Attributes
+    ----------
+    pages : tuple of str or StreamlitPage
+        The pages in the left part of the navbar, without their sections.
+    right : tuple of str or StreamlitPage
+        The pages in the right part of the navbar, without their sections.
+    logo_page : str or None
+        The page value that will be returned when the logo is selected.
+    styles : dict of {str : dict of {str : str}} or None
+        The CSS styles of the navbar.
+    css : str or None
+        The custom CSS of the navbar.
+    options : bool or dict of {str : bool}
+        The options toggled on or off.
+    adjust : bool
+        Whether to make the CSS adjustments.
+    warm_up : bool
+        Whether to import the modules of the lazy pages in the background.
+    links : tuple
+        The stylesheets included in the component.
+    default : str
+        The key of the page selected on first render.
+    default_page : StreamlitPage
+        The page object of the default page.
+    logo : bytes or None
+        The contents of the SVG file for the logo, if there is one.
+    base64_logo : str or None
+        The contents of the logo encoded in base64, if there is one.
+    icon_font : bytes or None
+        The font with the icons of the pages, if there are any.
+    base64_icon_font : str or None
+        The font with the icons encoded in base64, if there are any.
+    left_items : tuple of dict
+        The payload of each page and section in the left part of the navbar.
+    right_items : tuple of dict
+        The payload of each page and section in the right part of the navbar.
+    pagehash_to_pageinfo : dict of {str : dict}
+        The pages to register in the app, by their script hash.
+    registry : PageRegistry
+        The page objects of the navbar, indexed for lookups.
+    page_indices : dict of {str : int}
+        The position in the list of pages of each ``StreamlitPage`` given by
+        the user, by its lowercase key.
+    page_refs : tuple of PageRef
+        The page functions of the lazy pages, which are imported when the
+        page runs.
+    hashes : dict of {str : str}
+        The content hash of each heavy component argument, by its name.
+    sizes : dict of {str : int}
+        The size in bytes of each heavy component argument serialized, by its
+        name.
+
+    Methods
+    -------
+    navigation_msg(page_script_hash)
+        Get the navigation message that selects a page.
+    navigation_size(page_script_hash)
+        Get the size of the navigation message that selects a page.
+
+    Examples
+    --------
+    >>> import streamlit as st
+    >>> from streamlit_navigation_bar import NavbarSpec, st_navbar
+    >>> @st.cache_resource
+    ... def navbar_spec():
+    ...     return NavbarSpec(["Home", "Documentation", "Examples"])
+    >>> page = st_navbar(navbar_spec(), key="navbar")
+    """
+
+    __slots__ = (
+        "pages",
+        "right",
+        "logo_page",
+        "styles",
+        "css",
+        "options",
+        "adjust",
+        "warm_up",
+        "links",
+        "default",
+        "default_page",
+        "logo",
+        "base64_logo",
+        "icon_font",
+        "base64_icon_font",
+        "left_items",
+        "right_items",
+        "pagehash_to_pageinfo",
+        "registry",
+        "page_indices",
+        "page_refs",
+        "hashes",
+        "sizes",
+        "_messages",
+    )
+
+    def __init__(
+        self,
+        pages,
+        right=None,
+        selected=sentinel,
+        logo_path=None,
+        logo_page="Home",
+        urls=None,
+        icons=None,
+        styles=None,
+        css=None,
+        options=True,
+        adjust=True,
+        links=None,
+        warm_up=False,
+    ):
+        """
+        Validate the arguments and prepare the navbar.
+
+        The parameters are the same as the ones from ``st_navbar`` that
+        describe the navbar. Check its docstring for a description of each
+        one.
+
+        It must be instantiated while a Streamlit script runs, since the
+        pages are registered in the app.
+
+        Raises
+        ------
+        StreamlitAPIException
+            If an argument is invalid, or there is no script running.
+        """
+        if get_script_run_ctx() is None:
+            raise StreamlitAPIException(
+                "NavbarSpec() must be called while the app script runs, for "
+                "example in a module imported by it or in a function decorated "
+                "with st.cache_resource."
+            )
+
+        with stage("validate_spec"):
+            check_sections(pages, "pages")
+            check_sections(right, "right")
+            left_sections = _sections(pages)
+            right_sections = _sections(right or [])
+            left = _flat_pages(pages)
+            right = _flat_pages(right or [])
+            pages = left + right
+
+            check_pages(pages)
+            registry = PageRegistry(pages)
+            check_selected(selected, logo_page, logo_path, registry)
+            check_logo_path(logo_path)
+            check_logo_page(logo_page)
+            check_urls(urls, registry)
+            check_styles(styles)
+            check_options(options)
+            check_adjust(adjust)
+            check_warm_up(warm_up)
+
+        with stage("prepare"):
+            # Turn the references to page functions into lazy pages.
+            lazy_pages = {
+                page: st.Page(page, icon=(icons or {}).get(page))
+                for page in pages
+                if isinstance(page, PageRef)
+            }
+            if lazy_pages:
+                left = [lazy_pages.get(page, page) for page in left]
+                right = [lazy_pages.get(page, page) for page in right]
+                pages = left + right
+                if selected in lazy_pages:
+                    selected = lazy_pages[selected].url_path
+
+            if selected is sentinel:
+                if logo_path is not None:
+                    default = logo_page
+                else:
+                    default = (
+                        pages[0] if isinstance(pages[0], str) else pages[0].url_path
+                    )
+            else:
+                default = selected
+
+            default = default.lower()
+
+            logo = None
+            base64_logo = None
+            if logo_path is not None:
+                logo = _read_svg(logo_path)
+                base64_logo = _encode_file(logo)
+
+            urls = _prepare_urls(urls, pages)
+
+            if icons is None:
+                icons = {}
+            icons = {k: v.strip(":").split("/")[-1] for k, v in icons.items()}
+
+            page_indices = {}
+
+            reserve_placeholders(
+                sum(isinstance(page, str) for page in pages) + bool(logo_path)
+            )
+            if logo_path:
+                st_page = placeholder_page(
+                    logo_page, logo_page.lower(), icons.get(logo_page)
+                )
+                registry.add(st_page)
+
+            # TODO: code here is weird
+            def to_dict(page, index):
+                if isinstance(page, StreamlitPage):
+                    page._default = False
+                    page_indices[page.url_path.lower()] = index
+                    registry.add(page)
+                    return {
+                        "title": page.title,
+                        "icon": icon_name(page.icon) or page.icon or None,
+                        "url": urls.get(page.title, ["#", "_self"]),
+                        "key": page.url_path,
+                    }
+                else:
+                    st_page = placeholder_page(page, page.lower())
+                    registry.add(st_page)
+                    return {
+                        "title": page,
+                        "icon": icons.get(page),
+                        "url": urls.get(page, ["#", "_self"]),
+                        "key": page.lower(),
+                    }
+
+            left_items = [to_dict(title, i) for i, title in enumerate(left)]
+            right_items = [
+                to_dict(title, i) for i, title in enumerate(right, start=len(left))
+            ]
+
+            # Subset the icon font to the icons of the pages, which are then
+            # rendered by their glyph in it.
+            names = {
+                item["icon"]: icon_name(item["icon"])
+                for item in left_items + right_items
+            }
+            font = icon_font(name for name in names.values() if name is not None)
+            base64_font = None
+            if font is not None:
+                if font.data is not None:
+                    base64_font = _encode_file(font.data)
+                else:
+                    # Without a subset, the font of Google Fonts is loaded, where
+                    # the icons are the ligatures of their names.
+                    links = [*(links or []), FONT_STYLESHEET]
+                for item in left_items + right_items:
+                    name = names[item["icon"]]
+                    item["icon"] = font.glyphs.get(name, name or item["icon"])
+
+            left_items = _group_items(left_items, left_sections)
+            right_items = _group_items(right_items, right_sections)
+
+            default_page = registry.by_url_path(default)
+            # The placeholder pages are shared, so only the navbar knows that
+            # one of them is its default page.
+            if not is_placeholder(default_page):
+                default_page._default = True
+
+            # Prepare frontend navigation
+            pagehash_to_pageinfo: dict[PageHash, PageInfo] = {}
+            for page in registry.page_objects:
+                if isinstance(page._page, Path):
+                    script_path = str(page._page)
+                else:
+                    script_path = ""
+
+                script_hash = page._script_hash
+                pagehash_to_pageinfo[script_hash] = {
+                    "page_script_hash": script_hash,
+                    "page_name": page.title,
+                    "icon": page.icon,
+                    "script_path": script_path,
+                    "url_pathname": "" if page is default_page else page.url_path,
+                }
+
+            prepared = {
+                "pages": left,
+                "right": right,
+                "logo_page": logo_page,
+                "styles": styles,
+                "css": css,
+                "options": options,
+                "adjust": adjust,
+                "warm_up": warm_up,
+                "links": links or [],
+                "default": default,
+                "default_page": default_page,
+                "logo": logo,
+                "base64_logo": base64_logo,
+                "icon_font": font.data if font is not None else None,
+                "base64_icon_font": base64_font,
+                "left_items": left_items,
+                "right_items": right_items,
+                "pagehash_to_pageinfo": pagehash_to_pageinfo,
+                "registry": registry,
+                "page_indices": page_indices,
+                "page_refs": tuple(
+                    page._page
+                    for page in registry.page_objects
+                    if isinstance(page._page, PageRef)
+                ),
+                "_messages": {},
+            }
+            prepared["hashes"] = {
+                "left": _content_hash(left_items),
+                "right": _content_hash(right_items),
+                "styles": _content_hash(styles),
+                "css": _content_hash(css),
+                "links": _content_hash(prepared["links"]),
+                "base64_svg": _content_hash(base64_logo),
+                "base64_icon_font": _content_hash(base64_font),
+            }
+            prepared["sizes"] = {
+                "left": json_size(left_items),
+                "right": json_size(right_items),
+                "styles": json_size(styles),
+                "css": json_size(css),
+                "links": json_size(prepared["links"]),
+                "base64_svg": json_size(base64_logo),
+                "base64_icon_font": json_size(base64_font),
+            }
+            for name, value in prepared.items():
+                if name not in ("registry", "_messages"):
+                    value = _freeze(value)
+                object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"NavbarSpec is immutable, can not set '{name}'")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"NavbarSpec is immutable, can not delete '{name}'")
+
+    def navigation_msg(self, page_script_hash):
+        """
+        Get the navigation message that selects a page.
+
+        The message is built once for each page and copied afterwards, since
+        enqueueing it may change it. It always has all the pages of the app,
+        since Streamlit's frontend replaces its pages with the ones of each
+        navigation message, and resolves the URLs of back, forward and deep
+        links against them.
+
+        Parameters
+        ----------
+        page_script_hash : str
+            The script hash of the page to select in the navigation.
+
+        Returns
+        -------
+        msg : ForwardMsg
+            A message with the pages of the app and the selected one.
+        """
+        msg = ForwardMsg()
+        msg.CopyFrom(self._navigation(page_script_hash)[0])
+        return msg
+
+    def navigation_size(self, page_script_hash):
+        """
+        Get the size of the navigation message that selects a page.
+
+        Parameters
+        ----------
+        page_script_hash : str
+            The script hash of the page to select in the navigation.
+
+        Returns
+        -------
+        size : int
+            The size of the serialized message, in bytes.
+        """
+        return self._navigation(page_script_hash)[1]
+
+    def _navigation(self, page_script_hash):
+        """Build the navigation message that selects a page, and its size."""
+        if page_script_hash not in self._messages:
+            msg = ForwardMsg()
+            msg.navigation.position = NavigationProto.Position.HIDDEN
+            msg.navigation.expanded = False
+
+            msg.navigation.sections[:] = [""]
+            for page in self.registry.page_objects:
+                is_default = page is self.default_page
+                p = msg.navigation.app_pages.add()
+                p.page_script_hash = page._script_hash
+                p.page_name = page.title
+                p.icon = page.icon
+                p.is_default = is_default
+                p.section_header = ""
+                p.url_pathname = "" if is_default else page.url_path
+
+            msg.navigation.page_script_hash = page_script_hash
+            self._messages[page_script_hash] = (msg, msg.ByteSize())
+
+        return self._messages[page_script_hash]
+
+
+@timed("st_navbar")
 def st_navbar(
     pages,
     right=None,
@@ -296,6 +1055,11 @@ def st_navbar(
     allow_reselect=False,
     set_path=False,
     links=None,
+    warm_up=False,
+    on_prefetch=None,
+    prefetch_delay=200,
+    click_window=0,
+    on_perf=None,
     key=None,
 ):
     """
@@ -308,14 +1072,31 @@ def st_navbar(
 
     Parameters
     ----------
-    pages : list of str
+    pages : list of str or PageRef, dict of {str : list} or NavbarSpec
         A list with the name of each page that will be displayed in the
-        navigation bar.
-    right : list of str
+        navigation bar. A ``PageRef``, such as
+        ``PageRef("pages.api:show_api")``, is a lazy page: the module is only
+        imported when the page is selected, and the title is inferred from
+        the function name, like ``st.Page`` does. A string is always the
+        title of a page, even with a colon, such as ``"Q1:Summary"``.
+
+        Like ``st.navigation``, it can also be a dictionary with the header of
+        each section as the key and the list of its pages as the value. Each
+        section is displayed as a dropdown, whose pages are only rendered
+        when it opens. The pages of the ``""`` header are not in a section,
+        and are displayed in the navbar itself.
+
+        It can also be a ``NavbarSpec`` built beforehand, to share the navbar
+        between all sessions. In this case, the other parameters that
+        describe the navbar must be given to the ``NavbarSpec`` instead, and
+        only `on_change`, `allow_reselect`, `set_path` and `key` are
+        accepted.
+    right : list of str or dict of {str : list of str}
         A list with the name of each page that will be displayed in the
-        right part of the navigation bar.
-    selected : str or None, optional
-        The preselected page on first render. It can be a name from `pages`,
+        right part of the navigation bar. Like `pages`, it can also be a
+        dictionary of sections.
+    selected : str, PageRef or None, optional
+        The preselected page on first render. It can be a page from `pages`,
         the `logo_page` (when there is a logo) or ``None``. Defaults to the
         `logo_page` value, if there is a logo. In case there is not one,
         defaults to the first page of the `pages` list. When set to ``None``,
@@ -393,11 +1174,43 @@ def st_navbar(
         If set to ``True``, selecting a page will also update the browser URL.
 
         This option makes the navigation bar behave more like streamlit's
-        native navigation component. It does cause brief flicker in the
-        navigation bar for each change.
+        native navigation component. The URL is pushed to the browser history
+        once per selection, and the back and forward buttons select the page
+        of the URL, without reloading the navbar.
     links : list
         A list of stylesheets to be included.
         This can be used to include new icons.
+    warm_up : bool, default=False
+        If set to ``True``, once the selected page is rendered, the modules
+        of the other lazy pages are imported in a background thread pool, so
+        they are ready when selected. Each module is only imported once per
+        process.
+    on_prefetch : callable, optional
+        A function called with the key of a page when the pointer rests on it,
+        as a hint that it is likely to be selected next. It runs in a
+        background thread pool, outside of the script run and without a
+        rerun, so it can fill ``st.cache_data`` for the page, but it can not
+        add elements to the app. The hints are dropped when the pool is busy.
+        It requires Streamlit 1.40 or later.
+    prefetch_delay : int, default=200
+        The time in milliseconds that the pointer must rest on a page to
+        call `on_prefetch`.
+    click_window : int, default=0
+        A time in milliseconds to coalesce rapid clicks into a single rerun.
+        The first click starts the window, during which the selected page is
+        highlighted right away, but only the last selection is sent to Python
+        when it ends. If it is the page already selected, nothing is sent,
+        unless `allow_reselect` is ``True``. By default, every click is sent
+        right away.
+    on_perf : callable, optional
+        A function called with a list of ``ClientMeasure`` named tuples, with
+        the ``name``, ``start`` and ``duration`` in seconds of performance
+        measures taken in the browser: ``"boot"``, ``"first-render"`` and
+        ``"first-paint"``, from the start of the iframe of the navbar to its
+        boot, its first render event and the first paint of the bar, and
+        ``"click"``, from a click to the selection sent to Python. The
+        measures are sent with the next selection, so they do not cause a
+        rerun, and the function is called by ``st_navbar`` in that rerun.
     key : str or int, optional
         A string or integer to use as a unique key for the component. If this
         is omitted, a key will be generated for the widget based on its
@@ -429,119 +1242,96 @@ def st_navbar(
        https://st-navbar-1.streamlit.app/
        height: 300px
     """
-    # Do some trickery to differentiate between
-    # the left part of the navigation menu
-    # and the right part
-    left = pages
-    right = right or []
-    pages = left + right
-
-    check_pages(pages)
-    check_selected(selected, logo_page, logo_path, pages)
-    check_logo_path(logo_path)
-    check_logo_page(logo_page)
-    check_urls(urls, pages)
-    check_styles(styles)
-    check_options(options)
-    check_adjust(adjust)
-    check_key(key)
-
-    if selected is sentinel:
-        if logo_path is not None:
-            default = logo_page
-        else:
-            default = pages[0] if isinstance(pages[0], str) else pages[0].url_path
-    else:
-        default = selected
-
-    default = default.lower()
-
-    base64_svg = None
-    if logo_path is not None:
-        base64_svg = _encode_svg(logo_path)
-
-    urls = _prepare_urls(urls, pages)
-
-    if icons is None:
-        icons = {}
-    icons = {k: v.strip(":").split("/")[-1] for k, v in icons.items()}
-
-    page_objects = {}
-    page_list = []
-
-    # disable regular mpa uses
-    PagesManager.uses_pages_directory = False
+    ctx = get_script_run_ctx()
+    session = ctx.session_state._state
+
+    with stage("validate"):
+        check_key(key)
+        check_on_prefetch(on_prefetch)
+        check_prefetch_delay(prefetch_delay)
+        check_click_window(click_window)
+        check_on_perf(on_perf)
+        if isinstance(pages, NavbarSpec):
+            check_spec_args(
+                right=right,
+                selected=selected,
+                logo_path=logo_path,
+                logo_page=logo_page,
+                urls=urls,
+                icons=icons,
+                styles=styles,
+                css=css,
+                options=options,
+                adjust=adjust,
+                links=links,
+                warm_up=warm_up,
+            )
 
-    if logo_path:
-        st_page = st.Page(
-            lambda: None,
-            title=logo_page,
-            icon=icons.get(logo_page),
-            url_path=logo_page.lower(),
+    if isinstance(pages, NavbarSpec):
+        spec = pages
+        # The page objects are the ones given to the spec.
+        left = spec.pages
+        right = spec.right
+    else:
+        # Do some trickery to differentiate between
+        # the left part of the navigation menu
+        # and the right part
+        left = pages
+        right = right or []
+
+        # Replay the navbar prepared by the previous run of this session,
+        # when none of the arguments changed.
+        args = fingerprint(
+            (
+                left,
+                right,
+                selected,
+                logo_path,
+                _file_signature(logo_path),
+                logo_page,
+                urls,
+                icons,
+                styles,
+                css,
+                options,
+                adjust,
+                links,
+                warm_up,
+                # Until the icon font is read, its stylesheet is linked, so
+                # the navbar is prepared again once the icons can be subset.
+                font_ready(),
+            )
         )
-        page_list.append(st_page)
-
-    # TODO: code here is weird
-    def to_dict(page):
-        if isinstance(page, StreamlitPage):
-            page._default = False
-            page_objects[page.url_path] = page
-            page_list.append(page)
-            return {
-                "title": page.title,
-                "icon": page.icon or None,
-                "url": urls.get(page.title, ["#", "_self"]),
-                "key": page.url_path,
-            }
-        else:
-            st_page = st.Page(
-                lambda: None,
-                title=page,
-                url_path=page.lower(),
+        spec = _memo.get(session, key, args)
+        if spec is None:
+            spec = NavbarSpec(
+                left,
+                right=right,
+                selected=selected,
+                logo_path=logo_path,
+                logo_page=logo_page,
+                urls=urls,
+                icons=icons,
+                styles=styles,
+                css=css,
+                options=options,
+                adjust=adjust,
+                links=links,
+                warm_up=warm_up,
             )
-            page_list.append(st_page)
-            return {
-                "title": page,
-                "icon": icons.get(page),
-                "url": urls.get(page, ["#", "_self"]),
-                "key": page.lower(),
-            }
+            _memo.put(session, key, args, spec)
 
-    left = [to_dict(title) for title in left]
-    right = [to_dict(title) for title in right]
+        # The page objects of this run, in the order of the spec.
+        left = _flat_pages(left)
+        right = _flat_pages(right)
 
-    default_page = next(page for page in page_list if default == page.url_path)
-    default_page_original_key = default_page.url_path
-    default_page._default = True
+    default = spec.default
+    default_page = spec.default_page
 
-    # Prepare frontend navigation
-    pagehash_to_pageinfo: dict[PageHash, PageInfo] = {}
-    for page in page_list:
-        if isinstance(page._page, Path):
-            script_path = str(page._page)
-        else:
-            script_path = ""
-
-        script_hash = page._script_hash
-        if script_hash in pagehash_to_pageinfo:
-            # The page script hash is soley based on the url path
-            # So duplicate page script hashes are due to duplicate url paths
-            raise StreamlitAPIException(
-                f"Multiple Pages specified with URL pathname {page.url_path}. "
-                "URL pathnames must be unique. The url pathname may be "
-                "inferred from the filename, callable name, or title."
-            )
-
-        pagehash_to_pageinfo[script_hash] = {
-            "page_script_hash": script_hash,
-            "page_name": page.title,
-            "icon": page.icon,
-            "script_path": script_path,
-            "url_pathname": page.url_path,
-        }
-
-    ctx = get_script_run_ctx()
-    ctx.pages_manager.set_pages(pagehash_to_pageinfo)
+    # The pages are only registered when the session does not have them yet.
+    with stage("register"):
+        if ctx.pages_manager.get_pages() is not spec.pagehash_to_pageinfo:
+            ctx.pages_manager.set_pages(spec.pagehash_to_pageinfo)
 
     # This allows deep links
     found_page = ctx.pages_manager.get_page_script(
@@ -551,62 +1341,145 @@ def st_navbar(
     if found_page and found_page["page_script_hash"] != default_page._script_hash:
         default = found_page["url_pathname"]
 
-    links = links or []
+    logo_url, base64_svg = None, None
+    if spec.logo is not None:
+        logo_url, base64_svg = _serve_file(
+            spec.logo, spec.base64_logo, "image/svg+xml", f"st_navbar_logo_{key}"
+        )
 
-    # Now run our own component
-    page_name, _ = _st_navbar(
-        left=left,
-        right=right,
+    # The icon font is only loaded when there are icons.
+    icon_font_url, base64_icon_font = None, None
+    if spec.icon_font is not None:
+        icon_font_url, base64_icon_font = _serve_file(
+            spec.icon_font,
+            spec.base64_icon_font,
+            "font/woff2",
+            f"st_navbar_icons_{key}",
+        )
+
+    heavy_args = {
+        "left": spec.left_items,
+        "right": spec.right_items,
+        "styles": spec.styles,
+        "css": spec.css,
+        "links": spec.links,
+        "base64_svg": base64_svg,
+        "base64_icon_font": base64_icon_font,
+    }
+
+    # The heavy arguments are only sent in full when they change. Without a
+    # key, the identity of the component depends on its arguments, so they
+    # are always sent in full to keep it.
+    if key is not None:
+        sent = _sent_args.get(session, key)
+        hashes = spec.hashes
+        if base64_svg is None:
+            hashes = {**hashes, "base64_svg": _content_hash(None)}
+        if base64_icon_font is None:
+            hashes = {**hashes, "base64_icon_font": _content_hash(None)}
+        heavy_args = _address_args(heavy_args, hashes, sent)
+        on_change = _resend_callback(on_change, key, sent)
+
+    prefetch_channel = None
+    if on_prefetch is not None:
+        # It is also the class that Streamlit gives to the container with the
+        # listener, which has this name as its key.
+        prefetch_channel = re.sub(r"[^a-zA-Z0-9_-]", "-", f"st_navbar_prefetch_{key}")
+
+    component_args = {
         # This is required for the first call
         # to ensure we return two values
-        default=(default, None),
-        base64_svg=base64_svg,
-        logo_page=logo_page.lower(),
-        styles=styles,
-        css=css,
-        on_change=on_change,
-        allow_reselect=allow_reselect,
-        links=links,
-        key=key,
-    )
-    if adjust:
-        adjust_css(styles, options, key, get_path("templates"))
-
-    page_name = page_name.lower()
-    if page_name == default_page_original_key:
-        page_to_return = default_page
-    else:
-        page_to_return = next(_ for _ in page_list if _.url_path == page_name)
-    page_to_return._can_be_called = True
-
-    msg = ForwardMsg()
-    msg.navigation.position = NavigationProto.Position.HIDDEN
-    msg.navigation.expanded = False
-
-    msg.navigation.sections[:] = [""]
-    for page in page_list:
-        p = msg.navigation.app_pages.add()
-        p.page_script_hash = page._script_hash
-        p.page_name = page.title
-        p.icon = page.icon
-        p.is_default = page._default
-        p.section_header = ""
-        p.url_pathname = page.url_path
-
-    if set_path:
-        msg.navigation.page_script_hash = page_to_return._script_hash
-    else:
-        msg.navigation.page_script_hash = default_page._script_hash
+        "default": (default, None),
+        "logo_url": logo_url,
+        "icon_font_url": icon_font_url,
+        "logo_page": spec.logo_page.lower(),
+        "allow_reselect": allow_reselect,
+        "prefetch_channel": prefetch_channel,
+        "prefetch_delay": prefetch_delay,
+        "click_window": click_window,
+        "set_path": set_path,
+        "root_page": spec.default.lower(),
+        "perf": on_perf is not None,
+        "key": key,
+        **heavy_args,
+    }
 
-    # Set the current page script hash to the page that is going to be executed
-    ctx.set_mpa_v2_page(page_to_return._script_hash)
+    # Now run our own component
+    with stage("component"):
+        value = _st_navbar(on_change=on_change, **component_args)
+    page_name = value[0]
+    if on_perf is not None and len(value) > 2:
+        batch = value[2].get("perf")
+        last = _perf_batches.get(session, key)
+        # The value is read again on the reruns that it did not cause, so
+        # each batch is only reported once.
+        if batch and batch["id"] != last.get("id"):
+            last["id"] = batch["id"]
+            on_perf(client_measures(batch))
+    css_size = 0
+    with stage("adjust_css"):
+        if spec.adjust:
+            css_size = adjust_css(spec.styles, spec.options, key)
+
+    if on_prefetch is not None:
+        with st.container(key=f"st_navbar_prefetch_{key}"):
+            html = f"<style>.st-key-{prefetch_channel} {{display: none;}}</style>"
+            st.html(html)
+            css_size += html_size(html)
+            _prefetch_listener(
+                on_prefetch, prefetch_channel, f"st_navbar_prefetch_hint_{key}"
+            )
 
-    # This will either navigation or yield if the page is not found
-    ctx.enqueue(msg)
+    page_name = page_name.lower()
+    page_to_return = spec.registry.by_key(page_name)
+    check_page_key(page_name, page_to_return)
+
+    if spec.warm_up and spec.page_refs:
+        # The other pages are imported once the selected one is rendered, at
+        # the end of the run of the script.
+        warm_up_pages(spec.page_refs, after=threading.current_thread())
+
+    with stage("navigation"):
+        if set_path:
+            # The component already pushed the URL of the page, so it is the
+            # one selected in the navigation.
+            selected_hash = page_to_return._script_hash
+        else:
+            selected_hash = default_page._script_hash
+        msg = spec.navigation_msg(selected_hash)
+
+        # Set the current page script hash to the page that is going to be executed
+        ctx.set_mpa_v2_page(page_to_return._script_hash)
+
+        navigation_size = spec.navigation_size(selected_hash)
+        # This will either navigation or yield if the page is not found
+        ctx.enqueue(msg)
+
+    # The heavy arguments were sized when the navbar was prepared, and the
+    # light ones are sized on every run, like Streamlit serializes them.
+    args_sizes = {}
+    for name, arg in component_args.items():
+        if name in spec.sizes:
+            args_sizes[name] = spec.sizes[name] if arg is not None else NULL_SIZE
+        else:
+            args_sizes[name] = json_size(arg)
+    record_payload(session, key, args_sizes, css_size, navigation_size)
 
     # For backwards compatibility
     # if the user passed a string iso a page we will return the title
-    if page_name in page_objects:
-        return page_to_return
+    if page_name in spec.page_indices:
+        # Return the page object from this run, instead of the one from the
+        # run that prepared the navbar.
+        index = spec.page_indices[page_name]
+        page = left[index] if index < len(left) else right[index - len(left)]
+        if isinstance(page, PageRef) or isinstance(pages, NavbarSpec):
+            # A lazy page, whose page object is the one of the navbar, or a
+            # page of a spec. Either is shared with other sessions, so this
+            # session marks and runs its own copy of it.
+            lazy = isinstance(page, PageRef)
+            page = copy.copy(page_to_return if lazy else page)
+        page._default = page_to_return is default_page
+        page._can_be_called = True
+        return page
     else:
         return page_to_return.title
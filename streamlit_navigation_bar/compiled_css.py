@@ -0,0 +1,147 @@
+# This file is generated from the Jinja templates in `templates/`, by running
+# `python streamlit_navigation_bar/templates/compile.py`. Do not edit it.
+
+
+class _Undefined:
+    """Represent a missing value, which is rendered as an empty string."""
+
+    def __bool__(self):
+        return False
+
+    def __str__(self):
+        return ""
+
+
+_undefined = _Undefined()
+
+
+def _getattr(obj, attribute):
+    """Get an attribute or, if there is not one, an item, like Jinja does."""
+    try:
+        return getattr(obj, attribute)
+    except AttributeError:
+        pass
+    try:
+        return obj[attribute]
+    except (TypeError, LookupError):
+        return _undefined
+
+
+def _getitem(obj, item):
+    """Get an item or, if there is not one, an attribute, like Jinja does."""
+    try:
+        return obj[item]
+    except (TypeError, LookupError):
+        pass
+    try:
+        return getattr(obj, item)
+    except AttributeError:
+        return _undefined
+
+
+def render_options_css(ui, options, margin, key):
+    """Render the `options.css` template, which extends `base.css`."""
+    out = []
+    out.append(
+        'iframe[title="streamlit_navigation_bar.st_navbar"] {\n    pointer-events: auto;\n    height: '
+    )
+    out.append(str(_getattr(ui, "height")))
+    out.append(
+        ";\n    position: fixed;\n    z-index: 9999;\n    top: 0px;\n    left: 0px;\n"
+    )
+    if margin:
+        out.append(
+            "    width: calc(100% - 6.8rem);\n    margin-left: 3.4rem;\n    margin-right: 3.4rem;\n"
+        )
+    else:
+        out.append("    width: 100%;\n")
+    out.append(
+        '}\n\n\nheader[data-testid="stHeader"] {\n    /* So that the navbar does not briefly disappear when switching pages */\n    z-index: 0;\n\n    /* Match navbar\'s height, e.g. for when `margin` is `True` */\n    height: '
+    )
+    out.append(str(_getattr(ui, "height")))
+    out.append(";\n    min-height: ")
+    out.append(str(_getattr(ui, "height")))
+    out.append(
+        ";\n\n    /* Match navbar's background color, e.g. for when `margin` is `True` */\n    background-color: "
+    )
+    out.append(str(_getattr(ui, "bg_color")))
+    out.append(
+        ';\n}\ndiv[data-testid="stAppViewBlockContainer"] {\n    /* Match Streamlit\'s default spacing after the body */\n    margin-bottom: calc(5.875rem + '
+    )
+    out.append(str(_getattr(ui, "height")))
+    out.append(
+        ");\n}\nsection.stMain {\n    pointer-events: auto;\n    position: relative;\n    top: "
+    )
+    out.append(str(_getattr(ui, "height")))
+    out.append(";\n}\n#stDecoration {\n    visibility: hidden;\n}\n\n")
+    if not _getitem(options, "show_menu"):
+        out.append('span[data-testid="stMainMenu"] {\n    visibility: hidden;\n}\n')
+    out.append(
+        'div[data-testid="stToolbar"] {\n    /* Align the button vertically to the navbar pages */\n    /* top: calc(('
+    )
+    out.append(str(_getattr(ui, "height")))
+    out.append(
+        ' - 2rem) / 2); */\n\n    /* Leave space to the left that is equal to the top and bottom */\n    right: 0.05rem;\n}\ndiv[class="stStatusWidget"] {\n    visibility: hidden;\n}\ndiv[class="stDeployButton"] {\n    visibility: hidden;\n}\ndiv[class="stAppDeployButton"] {\n    visibility: hidden;\n}\n\nspan[data-testid="stMainMenu"] path:nth-of-type(2) {\n    fill: '
+    )
+    out.append(str(_getattr(ui, "color")))
+    out.append(
+        ';\n}\nspan[data-testid="stMainMenu"]:hover path:nth-of-type(2) {\n    fill: '
+    )
+    out.append(str(_getattr(ui, "hover_color")))
+    out.append(
+        ';\n}\nspan[data-testid="stMainMenu"] button[data-testid="baseButton-headerNoPadding"]:hover {\n    background-color: '
+    )
+    out.append(str(_getattr(ui, "hover_bg_color")))
+    out.append(";\n}\n\n")
+    out.append(
+        'div[data-testid="stAppViewContainer"] {\n    pointer-events: auto;\n}\n\ndiv[data-testid="stMainBlockContainer"] {\n    pointer-events: none;\n    padding-top: 5rem;\n}\n\ndiv[data-testid="collapsedControl"], div[data-testid="stSidebarCollapsedControl"] {\n    pointer-events: auto;\n}\n\ndiv[data-testid="collapsedControl"], div[data-testid="stSidebarCollapsedControl"] div {\n    margin-top: unset;\n}\n\nsection[data-testid="stSidebar"] {\n    pointer-events: auto;\n}\n\nsection.stMain div.stVerticalBlock {\n    pointer-events: auto;\n}\n\n\n'
+    )
+    if not _getitem(options, "show_sidebar"):
+        out.append(
+            'div[data-testid="collapsedControl"], div[data-testid="stSidebarCollapsedControl"] {\n    visibility: hidden;\n}\n'
+        )
+    out.append(
+        'div[data-testid="collapsedControl"], div[data-testid="stSidebarCollapsedControl"] {\n    /* Leave space to the right that is equal to the top and bottom */\n    left: 0.3125rem;\n\n    /* Align the button vertically to the navbar pages */\n    top: calc(('
+    )
+    out.append(str(_getattr(ui, "height")))
+    out.append(
+        ' - 2rem) / 2);\n}\n\ndiv[data-testid="collapsedControl"] path:nth-of-type(2),\ndiv[data-testid="stSidebarCollapsedControl"] path:nth-of-type(2) {\n    fill: '
+    )
+    out.append(str(_getattr(ui, "color")))
+    out.append(
+        ';\n}\ndiv[data-testid="collapsedControl"]:hover path:nth-of-type(2),\ndiv[data-testid="stSidebarCollapsedControl"]:hover path:nth-of-type(2) {\n    fill: '
+    )
+    out.append(str(_getattr(ui, "hover_color")))
+    out.append(
+        ';\n}\ndiv[data-testid="collapsedControl"] button[data-testid="baseButton-headerNoPadding"]:hover,\ndiv[data-testid="stSidebarCollapsedControl"] button[data-testid="baseButton-headerNoPadding"]:hover {\n    background-color: '
+    )
+    out.append(str(_getattr(ui, "hover_bg_color")))
+    out.append(
+        ';\n}\ndiv[data-testid="stSidebarContent"] button[data-testid="baseButton-header"]:hover {\n    background-color: rgba(151, 166, 195, 0.25);\n}\n\n'
+    )
+    if _getitem(options, "hide_nav"):
+        out.append(
+            'div[data-testid="stSidebarNav"] {\n    display: none;\n\tbackground-color: red;\n}\ndiv[data-testid="stSidebarUserContent"] {\n}\n'
+        )
+    out.append("\n")
+    if _getitem(options, "fix_shadow"):
+        out.append(
+            'div[data-testid="stSidebarContent"] {\n    /* Streamlit\'s default sidebar shadow style */\n    /* box-shadow: rgba(0, 0, 0, 0.16) -2rem 0px 2rem 2rem; */\n    box-shadow: rgba(0, 0, 0, 0.16) -2rem 2rem 2rem 2rem;\n}\n'
+        )
+    if _getitem(options, "sidebar_under_navbar"):
+        out.append('section[data-testid="stSidebar"] {\n    background-color: ')
+        out.append(str(_getattr(ui, "bg_color")))
+        out.append(';\n}\ndiv[data-testid="stSidebarContent"] {\n    /* margin-top: ')
+        out.append(str(_getattr(ui, "height")))
+        out.append("; */\n    top: ")
+        out.append(str(_getattr(ui, "height")))
+        out.append(";\n    background-color: ")
+        out.append(str(_getattr(_getattr(ui, "theme"), "backgroundColor")))
+        out.append(";\n}\n")
+    out.append("\n")
+    out.append(
+        'div[data-testid="stBottom"] {\n    /* Compensate for section.main being repositioned */\n    pointer-events: auto;\n    bottom: '
+    )
+    out.append(str(_getattr(ui, "height")))
+    out.append(";\n}")
+    return "".join(out)
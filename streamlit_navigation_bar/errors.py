@@ -1,6 +1,8 @@
 from streamlit.errors import StreamlitAPIException
 from streamlit.navigation.page import StreamlitPage as Page
 
+from streamlit_navigation_bar.page_ref import PageRef
+
 
 def _type_error(param, name, expected):
     """Format a string with markdown syntax to describe a type error."""
@@ -49,7 +51,7 @@ def check_pages(pages):
         )
 
     for page in pages:
-        if not isinstance(page, (str, Page)):
+        if not isinstance(page, (str, Page, PageRef)):
             i = pages.index(page)
             raise StreamlitAPIException(
                 "The pages parameter from st_navbar() received a list that "
@@ -59,14 +61,33 @@ def check_pages(pages):
             )
 
 
+def check_sections(pages, name):
+    """Check if the sections in `pages` have valid headers and pages."""
+    if not isinstance(pages, dict):
+        return
+
+    for header, section in pages.items():
+        if not isinstance(header, str):
+            raise StreamlitAPIException(_dict_error(header, name, "key", "list"))
+        if not isinstance(section, list):
+            raise StreamlitAPIException(
+                f"The {name} parameter from st_navbar() received a dictionary "
+                "that has a value with an invalid type.\n"
+                "\nExpected: *dict of str: list*  "
+                f"\nGot: *dict of str: {type(section).__name__}*"
+            )
+
+
 def check_selected(selected, logo_page, logo_path, pages):
     """Check if `selected` has a valid type and value."""
     object()
     if selected is None or type(selected) is object:
         return
 
-    if not isinstance(selected, str):
-        raise StreamlitAPIException(_type_error(selected, "selected", ["str", "None"]))
+    if not isinstance(selected, (str, PageRef)):
+        raise StreamlitAPIException(
+            _type_error(selected, "selected", ["str", "PageRef", "None"])
+        )
 
     if selected not in pages:
         if selected != logo_page:
@@ -216,7 +237,104 @@ def check_adjust(adjust):
         raise StreamlitAPIException(_type_error(adjust, "adjust", ["bool"]))
 
 
+def check_warm_up(warm_up):
+    """Check if `warm_up` has a valid type."""
+    if not isinstance(warm_up, bool):
+        raise StreamlitAPIException(_type_error(warm_up, "warm_up", ["bool"]))
+
+
+def check_on_prefetch(on_prefetch):
+    """Check if `on_prefetch` is callable or None."""
+    if not callable(on_prefetch) and on_prefetch is not None:
+        raise StreamlitAPIException(
+            _type_error(on_prefetch, "on_prefetch", ["callable", "None"])
+        )
+
+
+def check_on_perf(on_perf):
+    """Check if `on_perf` is callable or None."""
+    if not callable(on_perf) and on_perf is not None:
+        raise StreamlitAPIException(
+            _type_error(on_perf, "on_perf", ["callable", "None"])
+        )
+
+
+def check_prefetch_delay(prefetch_delay):
+    """Check if `prefetch_delay` has a valid type and value."""
+    if not isinstance(prefetch_delay, int) or isinstance(prefetch_delay, bool):
+        raise StreamlitAPIException(
+            _type_error(prefetch_delay, "prefetch_delay", ["int"])
+        )
+
+    if prefetch_delay < 0:
+        raise StreamlitAPIException(
+            "The prefetch_delay parameter from st_navbar() received an invalid "
+            "value. The value must be larger than or equal to zero.\n"
+            "\nExpected: prefetch_delay >= 0  "
+            f"\nGot: prefetch_delay == {prefetch_delay}"
+        )
+
+
+def check_click_window(click_window):
+    """Check if `click_window` has a valid type and value."""
+    if not isinstance(click_window, int) or isinstance(click_window, bool):
+        raise StreamlitAPIException(_type_error(click_window, "click_window", ["int"]))
+
+    if click_window < 0:
+        raise StreamlitAPIException(
+            "The click_window parameter from st_navbar() received an invalid "
+            "value. The value must be larger than or equal to zero.\n"
+            "\nExpected: click_window >= 0  "
+            f"\nGot: click_window == {click_window}"
+        )
+
+
 def check_key(key):
     """Check if `key` has a valid type."""
     if not isinstance(key, str) and not isinstance(key, int) and key is not None:
         raise StreamlitAPIException(_type_error(key, "key", ["str", "int", "None"]))
+
+
+def check_page_key(page_key, page):
+    """Check if the page selected in the navbar is one of its pages."""
+    if page is None:
+        raise StreamlitAPIException(
+            "st_navbar() received the selection of a page that it does not "
+            "have. The value of its key in the session state must be the key "
+            "of one of its pages.\n"
+            "\nExpected: the key of a page of the navbar  "
+            f"\nGot: *{page_key!r}*"
+        )
+
+
+def check_spec_args(**args):
+    """Check if the arguments that describe the navbar are not given with a spec."""
+    defaults = {
+        "right": None,
+        "logo_path": None,
+        "logo_page": "Home",
+        "urls": None,
+        "icons": None,
+        "styles": None,
+        "css": None,
+        "options": True,
+        "adjust": True,
+        "links": None,
+        "warm_up": False,
+    }
+    for name, value in args.items():
+        if name == "selected":
+            # The default of `selected` is a placeholder object.
+            given = type(value) is not object
+        else:
+            given = value is not defaults[name] and value != defaults[name]
+
+        if given:
+            raise StreamlitAPIException(
+                f"The {name} parameter from st_navbar() received a value "
+                "together with a NavbarSpec. When the pages parameter is a "
+                "NavbarSpec, the arguments that describe the navbar must be "
+                "given to the NavbarSpec instead.\n"
+                f"\nExpected: NavbarSpec(..., {name}=...)  "
+                f"\nGot: st_navbar(spec, {name}=...)"
+            )
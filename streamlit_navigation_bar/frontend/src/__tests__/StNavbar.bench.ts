@@ -0,0 +1,79 @@
+import { bench, describe } from "vitest"
+import { mount } from "@vue/test-utils"
+import StNavbar from "../StNavbar.vue"
+
+// The arguments sent by Python for a navbar with "count" pages, without a
+// key, so the heavy arguments are sent in full.
+const makeArgs = (count: number, selected = "page-0") => ({
+  default: [selected, null],
+  left: Array.from({ length: count }, (_, i) => ({
+    title: `Page ${i}`,
+    icon: i % 2 ? "" : null,
+    url: ["#", "_self"],
+    key: `page-${i}`,
+  })),
+  right: [],
+  styles: {
+    nav: { "background-color": "royalblue" },
+    span: { "border-radius": "0.5rem", padding: "0.4375rem 0.625rem" },
+    active: { "background-color": "rgba(255, 255, 255, 0.25)" },
+    hover: { "background-color": "rgba(255, 255, 255, 0.35)" },
+  },
+  css: null,
+  links: [],
+  base64_svg: null,
+  base64_icon_font: null,
+  logo_url: null,
+  icon_font_url: null,
+  logo_page: "page-0",
+  allow_reselect: false,
+  prefetch_channel: null,
+  prefetch_delay: 200,
+})
+
+for (const count of [10, 100, 1000]) {
+  describe(`${count} pages`, () => {
+    const args = makeArgs(count)
+
+    bench("mount", () => {
+      mount(StNavbar, { props: { args } }).unmount()
+    })
+
+    // Select another page, which is the update made on every click. Only the
+    // pages that were and are now active should be rendered again.
+    const wrapper = mount(StNavbar, { props: { args } })
+    let selected = 0
+
+    bench("update", async () => {
+      selected = (selected + 1) % count
+      await wrapper.setProps({
+        args: { ...args, default: [`page-${selected}`, null] },
+      })
+    })
+  })
+}
+
+// The same pages in sections of 10, whose pages are only mounted when their
+// dropdown opens.
+const makeSectionArgs = (count: number) => {
+  const args = makeArgs(count)
+  const left = []
+  for (let i = 0; i < count; i += 10) {
+    left.push({
+      title: `Section ${i / 10}`,
+      key: `#Section ${i / 10}`,
+      items: args.left.slice(i, i + 10),
+    })
+  }
+  return { ...args, left }
+}
+
+for (const count of [100, 1000]) {
+  describe(`${count} pages in sections`, () => {
+    const args = makeSectionArgs(count)
+
+    bench("mount", () => {
+      mount(StNavbar, { props: { args } }).unmount()
+    })
+  })
+}
@@ -0,0 +1,92 @@
+import { afterEach, describe, expect, it, vi } from "vitest"
+import { flushPromises, mount, type VueWrapper } from "@vue/test-utils"
+import { Streamlit } from "streamlit-component-lib"
+import StNavbar from "../StNavbar.vue"
+
+vi.mock("streamlit-component-lib", () => ({
+  Streamlit: {
+    setComponentValue: vi.fn(),
+    setFrameHeight: vi.fn(),
+  },
+}))
+
+const makeArgs = (extra = {}) => ({
+  default: ["home", null],
+  left: ["Home", "Install"].map((title) => ({
+    title,
+    icon: null,
+    url: ["#", "_self"],
+    key: title.toLowerCase(),
+  })),
+  right: [],
+  styles: {},
+  css: null,
+  links: [],
+  base64_svg: null,
+  base64_icon_font: null,
+  logo_url: null,
+  icon_font_url: null,
+  logo_page: "home",
+  allow_reselect: false,
+  prefetch_channel: null,
+  prefetch_delay: 200,
+  click_window: 0,
+  perf: true,
+  ...extra,
+})
+
+const link = (wrapper: VueWrapper, title: string) =>
+  wrapper.findAll("a.navbar-anchor").find((a) => a.text().includes(title))!
+
+describe("selecting a page", () => {
+  afterEach(() => {
+    vi.mocked(Streamlit.setComponentValue).mockClear()
+  })
+
+  it("sends nothing when the page is already selected", async () => {
+    const wrapper = mount(StNavbar, { props: { args: makeArgs() } })
+    await link(wrapper, "Home").trigger("click")
+    expect(Streamlit.setComponentValue).not.toHaveBeenCalled()
+
+    await link(wrapper, "Install").trigger("click")
+    expect(Streamlit.setComponentValue).toHaveBeenCalledTimes(1)
+    // The measures of the click go with the selection of a new page.
+    const [value] = vi.mocked(Streamlit.setComponentValue).mock.calls[0]
+    expect((value as unknown[]).slice(0, 2)).toEqual(["install", null])
+
+    await link(wrapper, "Install").trigger("click")
+    expect(Streamlit.setComponentValue).toHaveBeenCalledTimes(1)
+    wrapper.unmount()
+  })
+
+  it("sends the page again with allow_reselect", async () => {
+    const args = makeArgs({ allow_reselect: true })
+    const wrapper = mount(StNavbar, { props: { args } })
+    await link(wrapper, "Home").trigger("click")
+    expect(Streamlit.setComponentValue).toHaveBeenCalledTimes(1)
+    wrapper.unmount()
+  })
+})
+
+describe("opening a section", () => {
+  it("sets the frame back to the height of the bar once it is closed", async () => {
+    const section = {
+      title: "More",
+      key: "#More",
+      items: makeArgs().left.map((page) => ({ ...page, key: `more-${page.key}` })),
+    }
+    const args = makeArgs({ left: [...makeArgs().left, section] })
+    // The iframe of the component can not be reached from another origin.
+    const wrapper = mount(StNavbar, { props: { args }, attachTo: document.body })
+    const toggle = wrapper.find("a.navbar-section")
+
+    await toggle.trigger("click")
+    await flushPromises()
+    vi.mocked(Streamlit.setFrameHeight).mockClear()
+
+    await toggle.trigger("click")
+    await flushPromises()
+    expect(Streamlit.setFrameHeight).toHaveBeenCalledWith(document.body.scrollHeight)
+    wrapper.unmount()
+  })
+})
@@ -1,4 +1,6 @@
 import { createApp } from 'vue'
 import App from './App.vue'
+import { mark } from './perf'
 
 createApp(App).mount('#app')
+mark('boot')
@@ -0,0 +1,72 @@
+// Performance marks and measures of the navbar, in the timeline of the iframe,
+// so they also show up in the performance panel of the browser. The measures
+// are queued, and only reported to Python with the next value of the
+// component, so they never cause a rerun of their own.
+
+const PREFIX = "st-navbar:"
+
+// The queue is bounded, in case no value is sent for a long time.
+const MAX_PENDING = 50
+
+export interface PerfMeasure {
+  name: string
+  start: number
+  duration: number
+}
+
+let pending: PerfMeasure[] = []
+let batch = 0
+
+export const mark = (name: string): void => {
+  try {
+    performance.mark(PREFIX + name)
+  } catch {
+    // The User Timing API is not available.
+  }
+}
+
+export const clearMarks = (...names: string[]): void => {
+  try {
+    for (const name of names) {
+      performance.clearMarks(PREFIX + name)
+    }
+  } catch {
+    // The User Timing API is not available.
+  }
+}
+
+// Measure from the mark `start`, or from the start of the iframe when it is
+// undefined, to the mark `end`, or now.
+export const measure = (name: string, start?: string, end?: string): void => {
+  try {
+    performance.measure(
+      PREFIX + name,
+      start && PREFIX + start,
+      end && PREFIX + end
+    )
+    const entries = performance.getEntriesByName(PREFIX + name, "measure")
+    const entry = entries[entries.length - 1]
+    performance.clearMeasures(PREFIX + name)
+    if (pending.length < MAX_PENDING) {
+      pending.push({
+        name,
+        start: entry.startTime,
+        duration: entry.duration,
+      })
+    }
+  } catch {
+    // A mark is missing, or the User Timing API is not available.
+  }
+}
+
+// Take the queued measures as a batch, with an id that is unique for the
+// iframe, so Python reports each batch once, even if the value is read again.
+export const takeMeasures = (): { id: string; measures: PerfMeasure[] } | null => {
+  if (!pending.length) {
+    return null
+  }
+  const measures = pending
+  pending = []
+  batch += 1
+  return { id: `${performance.timeOrigin}:${batch}`, measures }
+}
@@ -1,7 +1,7 @@
 /**
  * Vue.js specific composables
  */
-import { onMounted, onUpdated } from "vue"
+import { onMounted, onUnmounted, onUpdated } from "vue"
 import { Streamlit } from "streamlit-component-lib"
 
 export function useStreamlit() {
@@ -12,16 +12,48 @@ export function useStreamlit() {
    * component. If you decide not to call it, you should implement the
    * `onMounted` and `onUpdated` functions in your own component,
    * so that your plugin properly resizes.
+   *
+   * The height is reported when the body of the iframe is resized, instead
+   * of after every update. The resizes are coalesced into one message per
+   * animation frame, which is skipped if the height did not change, since
+   * each message makes Streamlit lay out the iframe again.
    */
+  if (typeof ResizeObserver === "undefined") {
+    onMounted((): void => Streamlit.setFrameHeight())
+    onUpdated((): void => Streamlit.setFrameHeight())
+    return
+  }
+
+  let observer: ResizeObserver | undefined
+  let frame: number | undefined
+  let lastHeight: number | undefined
+
+  const reportHeight = (): void => {
+    frame = undefined
+    const height = document.body.scrollHeight
+    if (height !== lastHeight) {
+      lastHeight = height
+      Streamlit.setFrameHeight(height)
+    }
+  }
+
+  const scheduleReport = (): void => {
+    if (frame === undefined) {
+      frame = window.requestAnimationFrame(reportHeight)
+    }
+  }
 
   onMounted((): void => {
-    // After we're rendered for the first time, tell Streamlit that our height
-    // has changed.
-    Streamlit.setFrameHeight()
+    // The observer is also called once when it starts observing, which
+    // reports the height of the first render.
+    observer = new ResizeObserver(scheduleReport)
+    observer.observe(document.body)
   })
 
-  onUpdated((): void => {
-    // After we're updated, tell Streamlit that our height may have changed.
-    Streamlit.setFrameHeight()
+  onUnmounted((): void => {
+    observer?.disconnect()
+    if (frame !== undefined) {
+      window.cancelAnimationFrame(frame)
+    }
   })
 }
@@ -1,17 +1,69 @@
 import { fileURLToPath, URL } from 'node:url'
+import { readFileSync, writeFileSync } from 'node:fs'
+import { join } from 'node:path'
+import { brotliCompressSync, constants, gzipSync } from 'node:zlib'
 
-import { defineConfig } from 'vite'
+import { defineConfig, type Plugin } from 'vite'
 import vue from '@vitejs/plugin-vue'
 
+// Write a Brotli and a gzip compressed copy next to each asset, so a proxy or
+// CDN in front of the app can serve them as they are.
+function precompress(): Plugin {
+  let outDir = 'dist'
+  return {
+    name: 'precompress',
+    apply: 'build',
+    configResolved(config) {
+      outDir = config.build.outDir
+    },
+    writeBundle(_options, bundle) {
+      for (const fileName in bundle) {
+        if (!/\.(js|css|html|svg)$/.test(fileName)) {
+          continue
+        }
+        const path = join(outDir, fileName)
+        const data = readFileSync(path)
+        writeFileSync(`${path}.gz`, gzipSync(data, { level: 9 }))
+        writeFileSync(`${path}.br`, brotliCompressSync(data, {
+          params: { [constants.BROTLI_PARAM_QUALITY]: 11 },
+        }))
+      }
+    },
+  }
+}
+
 // https://vitejs.dev/config/
 export default defineConfig({
   base: './',
   plugins: [
     vue(),
+    precompress(),
   ],
   resolve: {
     alias: {
       '@': fileURLToPath(new URL('./src', import.meta.url))
     }
-  }
+  },
+  define: {
+    // The components only use the Composition API, so the code of the
+    // Options API and of the devtools is left out of the Vue runtime.
+    __VUE_OPTIONS_API__: 'false',
+    __VUE_PROD_DEVTOOLS__: 'false',
+    __VUE_PROD_HYDRATION_MISMATCH_DETAILS__: 'false',
+  },
+  esbuild: {
+    // The logging calls are removed by the minifier, so only in production.
+    pure: ['console.log', 'console.debug'],
+  },
+  build: {
+    target: 'es2020',
+    modulePreload: { polyfill: false },
+    rollupOptions: {
+      treeshake: {
+        // Only the Streamlit object of the component lib is used, so its
+        // React wrappers are left out of the bundle.
+        moduleSideEffects: (id) => !id.includes('/node_modules/streamlit-component-lib/'),
+      },
+    },
+  },
 })
@@ -0,0 +1,236 @@
+import glob
+import io
+import os
+import threading
+from collections import namedtuple
+
+import streamlit
+from streamlit.logger import get_logger
+
+from streamlit_navigation_bar.lru_cache import LRUCache
+
+try:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+except ImportError:
+    subset = None
+    TTFont = None
+
+
+_LOGGER = get_logger(__name__)
+
+# The Material Symbols font, shipped with the package. The one that Streamlit
+# serves for its own icons is only read if it is missing.
+FONT_GLOBS = [
+    os.path.join(os.path.dirname(__file__), "fonts", "MaterialSymbols-Rounded*.woff2"),
+    os.path.join(
+        os.path.dirname(streamlit.__file__),
+        "static",
+        "static",
+        "media",
+        "MaterialSymbols-Rounded*.woff2",
+    ),
+]
+
+# The family of the font, the same as the one of the Google Fonts stylesheet,
+# which is linked instead when the font can not be subset.
+FONT_FAMILY = "Material Symbols Rounded"
+FONT_STYLESHEET = (
+    "https://fonts.googleapis.com/css2?family=Material+Symbols+Rounded&display=block"
+)
+
+MATERIAL_PREFIX = ":material/"
+
+IconFont = namedtuple("IconFont", ["data", "glyphs"])
+
+# The font subsets, by the icon names in them, shared by all sessions.
+_subsets = LRUCache(maxsize=32)
+
+# The contents of the full font, decompressed to be subset faster, and the
+# code point of each icon in it, which are read once per process, in a
+# background thread.
+_font = None
+_font_lock = threading.Lock()
+_font_thread = None
+
+
+def icon_name(icon):
+    """
+    Get the name of a Material Symbols icon, in snake case.
+
+    Parameters
+    ----------
+    icon : str or None
+        The icon in the ``":material/icon_name:"`` format, or only its name.
+        Anything else, such as an emoji, is not an icon of the font.
+
+    Returns
+    -------
+    name : str or None
+        The name of the icon, or ``None`` if it is not one of the font.
+    """
+    if not icon:
+        return None
+    if icon.startswith(MATERIAL_PREFIX):
+        return icon[len(MATERIAL_PREFIX) :].rstrip(":")
+    if icon.replace("_", "").isalnum() and icon.isascii():
+        return icon
+    return None
+
+
+def _read_font():
+    """Read the full font and map each icon name to its code point."""
+    if TTFont is None:
+        return (None, {})
+
+    paths = [path for pattern in FONT_GLOBS for path in glob.glob(pattern)]
+    if not paths:
+        _LOGGER.warning("The Material Symbols font was not found.")
+        return (None, {})
+
+    with open(paths[0], "rb") as file:
+        data = file.read()
+
+    try:
+        font = TTFont(io.BytesIO(data))
+        cmap = font.getBestCmap()
+        chars = {}
+        for codepoint, glyph in sorted(cmap.items()):
+            chars.setdefault(glyph, codepoint)
+
+        # Each icon is a ligature of the letters of its name.
+        codepoints = {}
+        for lookup in font["GSUB"].table.LookupList.Lookup:
+            for table in lookup.SubTable:
+                if lookup.LookupType == 7:
+                    table = table.ExtSubTable
+                for first, ligatures in getattr(table, "ligatures", {}).items():
+                    for ligature in ligatures:
+                        glyphs = [first, *ligature.Component]
+                        if ligature.LigGlyph not in chars:
+                            continue
+                        if not all(glyph in chars for glyph in glyphs):
+                            continue
+                        name = "".join(chr(chars[glyph]) for glyph in glyphs)
+                        codepoints[name.lower()] = chars[ligature.LigGlyph]
+
+        output = io.BytesIO()
+        font.flavor = None
+        font.save(output)
+    except Exception as error:
+        # The WOFF2 format needs Brotli, which fontTools does not require.
+        _LOGGER.warning(
+            "The icon font could not be decoded, so it is not subset: %s", error
+        )
+        return (None, {})
+    return (output.getvalue(), codepoints)
+
+
+def _load_font_thread():
+    global _font
+
+    font = _read_font()
+    with _font_lock:
+        _font = font
+
+
+def load_font(wait=False):
+    """
+    Read the full font, once per process, in a background thread.
+
+    Decoding the font and mapping its icons takes a second or so, which would
+    otherwise delay the first run of the app with icons.
+
+    Parameters
+    ----------
+    wait : bool, default=False
+        If set to ``True``, wait until the font is read.
+
+    Returns
+    -------
+    font : tuple or None
+        The contents of the font decompressed, or ``None`` if it could not be
+        read, and the code point of each icon, by its name. It is ``None``
+        while the font is being read.
+    """
+    global _font_thread
+
+    with _font_lock:
+        if _font is not None:
+            return _font
+        if _font_thread is None:
+            _font_thread = threading.Thread(
+                target=_load_font_thread, name="st_navbar_icon_font", daemon=True
+            )
+            _font_thread.start()
+        thread = _font_thread
+
+    if wait:
+        thread.join()
+        return _font
+    return None
+
+
+def font_ready():
+    """Check if the full font was read, so the icons can be subset."""
+    return _font is not None
+
+
+def icon_font(names):
+    """
+    Get a font with the Material Symbols icons used by the navbar.
+
+    The font is shipped with the package, and subset to the icons in
+    `names`, which are then referenced by their code point, so it is loaded
+    from the app, without any external request. This needs ``fontTools``.
+    Otherwise, and until the full font is read in the background, there is
+    no font data: the stylesheet of Google Fonts is linked instead, and the
+    icons are referenced by the ligature of their name.
+
+    Parameters
+    ----------
+    names : iterable of str
+        The names of the icons, in snake case.
+
+    Returns
+    -------
+    font : IconFont or None
+        A named tuple with the ``data`` of the font in the WOFF2 format, and
+        the text to render each icon in ``glyphs``, by its name. Its ``data``
+        is ``None`` when the font can not be subset, and it is ``None`` when
+        there are no icons.
+    """
+    names = frozenset(names)
+    if not names:
+        return None
+
+    cached = _subsets.get(names)
+    if cached is not None:
+        return cached
+
+    font = load_font()
+    if font is None:
+        # The full font is still being read, so it is not cached.
+        return IconFont(None, {})
+
+    sfnt, codepoints = font
+    found = {name: codepoints[name] for name in names if name in codepoints}
+    if sfnt is None or not found:
+        font = IconFont(None, {})
+    else:
+        options = subset.Options()
+        options.layout_features = []
+        options.name_IDs = []
+        options.notdef_outline = True
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=found.values())
+        ttfont = TTFont(io.BytesIO(sfnt))
+        subsetter.subset(ttfont)
+        ttfont.flavor = "woff2"
+        output = io.BytesIO()
+        ttfont.save(output)
+        glyphs = {name: chr(codepoint) for name, codepoint in found.items()}
+        font = IconFont(output.getvalue(), glyphs)
+
+    _subsets.put(names, font)
+    return font
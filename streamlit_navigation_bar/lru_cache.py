@@ -0,0 +1,135 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+
+class LRUCache:
+    """
+    Represent a thread-safe mapping with a maximum number of entries.
+
+    When a new entry is added to a full cache, the least recently used entry
+    is evicted, where using an entry means either adding or getting it. The
+    cache is shared by all the sessions of the process, so every operation
+    holds a lock.
+
+    Attributes
+    ----------
+    maxsize : int
+        The maximum number of entries kept in the cache.
+
+    Methods
+    -------
+    get(key)
+        Get the value of an entry and mark it as the most recently used.
+    put(key, value)
+        Add an entry, evicting the least recently used one if it is full.
+    grow(maxsize)
+        Raise the maximum number of entries, if it is smaller.
+    info()
+        Get the statistics of the cache.
+    clear()
+        Remove all entries and reset the statistics.
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        Instantiate an empty cache.
+
+        Parameters
+        ----------
+        maxsize : int, default=128
+            The maximum number of entries kept in the cache. It must be larger
+            than or equal to one.
+        """
+        if maxsize < 1:
+            raise ValueError("The maxsize of the cache must be at least 1.")
+
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key):
+        """
+        Get the value of an entry and mark it as the most recently used.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the entry.
+
+        Returns
+        -------
+        value : object or None
+            The value of the entry, or ``None`` if it is not in the cache.
+        """
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, value):
+        """
+        Add an entry, evicting the least recently used one if it is full.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the entry.
+        value : object
+            The value of the entry.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def grow(self, maxsize):
+        """
+        Raise the maximum number of entries, if it is smaller.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of entries that the cache must be able to keep.
+        """
+        with self._lock:
+            self.maxsize = max(self.maxsize, maxsize)
+
+    def info(self):
+        """
+        Get the statistics of the cache.
+
+        Returns
+        -------
+        info : CacheInfo
+            A named tuple with the ``hits``, ``misses``, ``evictions``,
+            ``maxsize`` and ``currsize`` fields.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
@@ -1,5 +1,6 @@
+import re
+
 from streamlit.config import get_config_options
-from streamlit_theme import st_theme
 
 
 class MatchNavbar:
@@ -17,10 +18,9 @@ class MatchNavbar:
         the key-value pair is the name of a CSS property and the value it
         takes, both in string format. It accepts CSS variables to be passed as
         values.
-    key : str, int or None
-        A key associated with the container that gets the theme. This needs to
-        be unique since all styles will be applied to the container with this
-        key.
+    theme : dict of {str : str}
+        A dictionary with the name of each theme variable as the key and the
+        CSS variable that holds its value in the app as the value.
 
     Methods
     -------
@@ -36,7 +36,7 @@ class MatchNavbar:
         "var(--font)": "font",
     }
 
-    def __init__(self, styles, key):
+    def __init__(self, styles):
         """
         Instantiate a user interface object to get CSS that matches the navbar.
 
@@ -48,53 +48,81 @@ class MatchNavbar:
             dictionary, the key-value pair is the name of a CSS property and
             the value it takes, both in string format. It accepts CSS variables
             to be passed as values.
-        key : str, int or None
-            A key associated with the container that gets the theme. This needs
-            to be unique since all styles will be applied to the container with
-            this key.
         """
         self.styles = styles
-        self.theme = st_theme(key=f"key_{key}")
+        self.theme = {
+            theme_config: self._get_theme_config([theme_config])
+            for theme_config in self.configs.values()
+        }
+
+    @staticmethod
+    def theme_var(theme_config):
+        """
+        Get the name of the CSS variable that holds a theme variable.
+
+        The navbar component receives the active theme from Streamlit, and
+        sets these CSS variables in the app, whenever the theme changes.
+
+        Parameters
+        ----------
+        theme_config : str
+            The name of the frontend theme variable, e.g. ``"textColor"``.
+
+        Returns
+        -------
+        name : str
+            The name of the CSS variable, e.g. ``"--st-navbar-text-color"``.
+        """
+        return "--st-navbar-" + re.sub(r"([A-Z])", r"-\1", theme_config).lower()
 
-    def _get_theme_config(self, theme_configs):
+    def _get_theme_config(self, theme_configs, default=None):
         """
         Get the value of a CSS property from the theme or config option.
 
-        Try to find the value with the name at the beginning of the list.
-        Search first in the frontend theme object and then in the configuration
-        options. In case it does not find it, iterates to the next name.
-        Whenever the value is found it is returned immediately. If at the end
-        it is still not found, returns ``None``.
+        Build a CSS variable with the theme variable at the beginning of the
+        list, whose value is set in the frontend from the active theme. Its
+        fallback is the configuration option with the same name or, in case it
+        is not set, the CSS variable built with the next name in the list. If
+        at the end there is still no fallback, uses the default, if any.
+
+        This way, the value is taken from the frontend theme object first and
+        then from the configuration options, without having to get the theme
+        in Python, which would require an extra component and rerun.
 
         Parameters
         ----------
         theme_configs : list of str
             A list with the names of the frontend theme variables, which are
             also Streamlit's configuration options, to get the value from.
+        default : str, optional
+            The value to be used when none of the theme variables or config
+            options are set. Defaults to ``None``, where there is no value.
 
         Returns
         -------
-        value : str or None
-            The value of the CSS property found in `styles`, `theme` or config
-            options. If not found, returns ``None``.
+        value : str
+            A CSS variable with the fallbacks for the CSS property.
         """
-        theme = self.theme
         configs = self.configs.values()
+        value = default
 
-        # Get the value for the var in `styles`, then, for the `theme_config`.
-        for theme_config in theme_configs:
-            # Return the CSS value from `theme`.
-            if theme is not None and theme_config in theme:
-                return theme[theme_config]
+        # The first name in the list has the highest precedence, so the CSS
+        # variables are nested from the last to the first.
+        for theme_config in reversed(theme_configs):
+            if theme_config not in configs:
+                continue
 
-            # Return the CSS value from configs, like a TOML file.
-            if theme_config in configs:
-                value = get_config_options()[f"theme.{theme_config}"].value
-                if value is not None:
-                    return value
+            # Fall back to the CSS value from configs, like a TOML file.
+            config = get_config_options()[f"theme.{theme_config}"].value
+            if config is not None:
+                value = config
 
-        # Not found.
-        return None
+            if value is None:
+                value = f"var({self.theme_var(theme_config)})"
+            else:
+                value = f"var({self.theme_var(theme_config)}, {value})"
+
+        return value
 
     def _get_style(self, css_property, targets):
         """
@@ -157,7 +185,9 @@ class MatchNavbar:
         frontend theme object and finally in the configuration options. When it
         does not find with the first method, it goes to the next one in the
         sequence. Whenever the value is found it is returned immediately. If at
-        the end it is still not found, returns a default value.
+        the end it is still not found, returns a default value. The frontend
+        theme is only known by the browser, so for the last two methods a CSS
+        variable with fallbacks is returned.
 
         Parameters
         ----------
@@ -205,11 +235,7 @@ class MatchNavbar:
         if value in configs:
             theme_configs.append(value)
 
-        theme_configs.append(theme_config)
-        value = self._get_theme_config(theme_configs)
+        if theme_config is not None:
+            theme_configs.append(theme_config)
 
-        # Not found, return the default.
-        if value is None:
-            return default
-
-        return value
+        return self._get_theme_config(theme_configs, default)
@@ -0,0 +1,63 @@
+import streamlit as st
+
+from streamlit_navigation_bar.lru_cache import LRUCache
+
+
+# The page objects that stand for the pages given as strings, shared by all
+# navbars and sessions of the process. It grows to hold the pages of the
+# largest navbar, which would otherwise evict its own pages, and get new
+# ones in each session.
+_placeholders = LRUCache(maxsize=1024)
+
+
+def _no_page():
+    """Stand for a page given as a string, which does not run anything."""
+
+
+def reserve_placeholders(count):
+    """
+    Make room in the pool for the page objects of a navbar.
+
+    Parameters
+    ----------
+    count : int
+        The number of pages given as strings in the navbar.
+    """
+    _placeholders.grow(count)
+
+
+def placeholder_page(title, url_path, icon=None):
+    """
+    Get the page object that stands for a page given as a string.
+
+    The pages given as strings only need a page object to be registered in
+    the app, so the same object is returned for the same arguments, in every
+    rerun and session, instead of building a new one each time. Since it is
+    shared, it must never be changed: whether it is the default page of a
+    navbar is tracked by the navbar itself.
+
+    Parameters
+    ----------
+    title : str
+        The title of the page.
+    url_path : str
+        The URL path of the page.
+    icon : str or None, default=None
+        The icon of the page.
+
+    Returns
+    -------
+    page : StreamlitPage
+        The shared page object.
+    """
+    key = (title, url_path, icon)
+    page = _placeholders.get(key)
+    if page is None:
+        page = st.Page(_no_page, title=title, icon=icon, url_path=url_path)
+        _placeholders.put(key, page)
+    return page
+
+
+def is_placeholder(page):
+    """Check if a page object stands for a page given as a string."""
+    return page._page is _no_page
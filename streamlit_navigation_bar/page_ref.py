@@ -0,0 +1,159 @@
+import importlib
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from streamlit.logger import get_logger
+
+
+_LOGGER = get_logger(__name__)
+
+# A reference to a function of a module, such as "pages.api:show_api".
+_REF_PATTERN = re.compile(r"[A-Za-z_][\w.]*:[A-Za-z_]\w*")
+
+# The pool that imports the page modules in the background, created on the
+# first warm-up, and the references already submitted to it.
+_pool = None
+_pool_lock = threading.Lock()
+_submitted = set()
+
+
+class PageRef:
+    """
+    Represent a page function that is only imported when the page runs.
+
+    It is a callable that can be passed to ``st.Page`` in place of the page
+    function, so the module of the page is not imported until the page is
+    selected. A ``PageRef`` in the list of pages of ``st_navbar`` is turned
+    into ``st.Page(page_ref)``, while a string is always the title of a page,
+    even with a colon, such as ``"Q1:Summary"``.
+
+    Attributes
+    ----------
+    module : str
+        The name of the module with the page function.
+    loaded : bool
+        Whether the page function was already imported.
+
+    Methods
+    -------
+    load()
+        Import the page function, if it was not imported yet, and return it.
+
+    Examples
+    --------
+    >>> import streamlit as st
+    >>> from streamlit_navigation_bar import PageRef, st_navbar
+    >>> page = st_navbar(
+    ...     [
+    ...         PageRef("pages.home:show_home"),
+    ...         st.Page(PageRef("pages.api:show_api"), title="API"),
+    ...     ]
+    ... )
+    >>> page.run()
+    """
+
+    def __init__(self, ref):
+        """
+        Instantiate a reference to a page function.
+
+        Parameters
+        ----------
+        ref : str
+            The reference in the ``"module:function"`` format, where the
+            module is an importable dotted name, such as
+            ``"pages.api:show_api"``.
+
+        Raises
+        ------
+        ValueError
+            If `ref` is not in the ``"module:function"`` format.
+        """
+        if _REF_PATTERN.fullmatch(ref) is None:
+            raise ValueError(
+                f"Invalid page reference '{ref}'. The expected format is "
+                "'module:function'."
+            )
+
+        self.module, self.__name__ = ref.split(":")
+        self.__qualname__ = self.__name__
+        self._function = None
+
+    @property
+    def loaded(self):
+        return self._function is not None
+
+    def load(self):
+        """
+        Import the page function, if it was not imported yet, and return it.
+
+        Returns
+        -------
+        function : callable
+            The page function.
+        """
+        if self._function is None:
+            module = importlib.import_module(self.module)
+            self._function = getattr(module, self.__name__)
+        return self._function
+
+    def __call__(self):
+        return self.load()()
+
+    def __eq__(self, other):
+        if not isinstance(other, PageRef):
+            return NotImplemented
+        return (self.module, self.__name__) == (other.module, other.__name__)
+
+    def __hash__(self):
+        return hash((PageRef, self.module, self.__name__))
+
+    def __repr__(self):
+        return f"PageRef('{self.module}:{self.__name__}')"
+
+
+def _load_in_background(page_ref, after):
+    if after is not None:
+        after.join()
+    try:
+        page_ref.load()
+    except Exception:
+        _LOGGER.warning("Failed to warm up the page %r.", page_ref, exc_info=True)
+
+
+def warm_up_pages(page_refs, max_workers=2, after=None):
+    """
+    Import the modules of pages in a background thread pool.
+
+    Each module is only submitted once per process, since it stays imported
+    afterwards. The errors are logged, and raised again when the page runs.
+
+    Parameters
+    ----------
+    page_refs : iterable of PageRef
+        The references to the pages to import.
+    max_workers : int, default=2
+        The number of threads of the pool, used when it is created.
+    after : threading.Thread, optional
+        A thread to wait for before importing, such as the one running the
+        script, so the imports do not slow down the page being rendered. The
+        main thread is never waited for, since it only ends with the process.
+    """
+    global _pool
+
+    if after is threading.main_thread():
+        after = None
+
+    with _pool_lock:
+        pending = [ref for ref in page_refs if not ref.loaded and ref not in _submitted]
+        if not pending:
+            return
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="st_navbar_warm_up",
+            )
+        _submitted.update(pending)
+
+    for ref in pending:
+        _pool.submit(_load_in_background, ref, after)
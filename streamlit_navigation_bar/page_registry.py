@@ -0,0 +1,107 @@
+from streamlit.errors import StreamlitAPIException
+
+
+class PageRegistry:
+    """
+    Represent the pages of the navbar, indexed for constant time lookups.
+
+    It is built once from the list of pages given to ``st_navbar``, which is
+    used to validate the other arguments, through the ``in`` operator and
+    ``len``. Then, each page object is added to it, to be looked up by its URL
+    path, title, lowercase key or script hash.
+
+    Attributes
+    ----------
+    pages : list of str or StreamlitPage
+        The pages given to ``st_navbar``, in order.
+    page_objects : list of StreamlitPage
+        The page objects added to the registry, in order.
+
+    Methods
+    -------
+    add(page)
+        Add a page object to the registry.
+    by_url_path(url_path)
+        Get the page object with a URL path.
+    by_title(title)
+        Get the first page object with a title.
+    by_key(key)
+        Get the page object with a key, in any case.
+    by_hash(page_script_hash)
+        Get the page object with a script hash.
+    """
+
+    def __init__(self, pages):
+        """
+        Instantiate a registry with the pages given to ``st_navbar``.
+
+        Parameters
+        ----------
+        pages : list of str or StreamlitPage
+            The pages given to ``st_navbar``, which must be hashable.
+        """
+        self.pages = pages
+        self.page_objects = []
+        self._items = set(pages)
+        self._by_url_path = {}
+        self._by_title = {}
+        self._by_key = {}
+        self._by_hash = {}
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __len__(self):
+        return len(self.pages)
+
+    def __iter__(self):
+        return iter(self.pages)
+
+    def __repr__(self):
+        return repr(self.pages)
+
+    def add(self, page):
+        """
+        Add a page object to the registry.
+
+        Parameters
+        ----------
+        page : StreamlitPage
+            The page object, whose URL path must not be the default one yet.
+
+        Raises
+        ------
+        StreamlitAPIException
+            If there is already a page with the same URL path.
+        """
+        script_hash = page._script_hash
+        if script_hash in self._by_hash:
+            # The page script hash is soley based on the url path
+            # So duplicate page script hashes are due to duplicate url paths
+            raise StreamlitAPIException(
+                f"Multiple Pages specified with URL pathname {page.url_path}. "
+                "URL pathnames must be unique. The url pathname may be "
+                "inferred from the filename, callable name, or title."
+            )
+
+        self.page_objects.append(page)
+        self._by_hash[script_hash] = page
+        self._by_url_path[page.url_path] = page
+        self._by_key.setdefault(page.url_path.lower(), page)
+        self._by_title.setdefault(page.title, page)
+
+    def by_url_path(self, url_path):
+        """Get the page object with a URL path, or ``None``."""
+        return self._by_url_path.get(url_path)
+
+    def by_title(self, title):
+        """Get the first page object with a title, or ``None``."""
+        return self._by_title.get(title)
+
+    def by_key(self, key):
+        """Get the page object with a key, in any case, or ``None``."""
+        return self._by_key.get(key.lower())
+
+    def by_hash(self, page_script_hash):
+        """Get the page object with a script hash, or ``None``."""
+        return self._by_hash.get(page_script_hash)
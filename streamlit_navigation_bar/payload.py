@@ -0,0 +1,167 @@
+import json
+import threading
+from collections import namedtuple
+
+from streamlit.runtime.scriptrunner_utils.script_run_context import (
+    get_script_run_ctx,
+)
+from streamlit.string_util import clean_text
+
+from streamlit_navigation_bar.session_memo import SessionStore
+
+
+PayloadSizes = namedtuple(
+    "PayloadSizes", ["args", "component", "css", "navigation", "total"]
+)
+
+PayloadTotals = namedtuple(
+    "PayloadTotals", ["calls", "args", "component", "css", "navigation", "total"]
+)
+
+# The size of an argument that is ``None``, serialized.
+NULL_SIZE = len("null")
+
+_totals = None
+_lock = threading.Lock()
+
+# The sizes of the last call of each navbar, by session and key.
+_last = SessionStore()
+
+
+def json_size(value):
+    """Get the size in bytes of a component argument, serialized by Streamlit."""
+    # Streamlit serializes the arguments with the default options, which
+    # escape anything that is not ASCII, so each character is a byte.
+    return len(json.dumps(value))
+
+
+def args_size(sizes):
+    """
+    Get the size in bytes of the serialized arguments of a component.
+
+    Streamlit serializes all the arguments together, in a JSON object, so
+    its size is the one of each argument, plus its quoted name and the
+    separators.
+
+    Parameters
+    ----------
+    sizes : dict of {str : int}
+        The size of each serialized argument, by its name.
+
+    Returns
+    -------
+    size : int
+        The size of the JSON object with all the arguments.
+    """
+    if not sizes:
+        return len("{}")
+    # Each argument is `"name": value`, and they are separated by `, `.
+    entries = sum(len(name) + 4 + size for name, size in sizes.items())
+    return 2 + entries + 2 * (len(sizes) - 1)
+
+
+def html_size(html):
+    """Get the size in bytes of the body of an ``st.html`` block."""
+    return len(clean_text(html).encode("utf-8"))
+
+
+def _empty_totals():
+    return PayloadTotals(0, {}, 0, 0, 0, 0)
+
+
+def record_payload(session, key, args, css, navigation):
+    """
+    Record the sizes of the payloads that a call of ``st_navbar`` added.
+
+    Parameters
+    ----------
+    session : SessionState
+        The session state object of the current session.
+    key : str, int or None
+        The key of the navbar.
+    args : dict of {str : int}
+        The size of each serialized component argument, by its name.
+    css : int
+        The size of the ``st.html`` blocks with the CSS adjustments.
+    navigation : int
+        The size of the navigation message.
+
+    Returns
+    -------
+    sizes : PayloadSizes
+        The sizes of the call.
+    """
+    global _totals
+
+    component = args_size(args)
+    total = component + css + navigation
+    sizes = PayloadSizes(args, component, css, navigation, total)
+    _last.get(session, key)["sizes"] = sizes
+
+    with _lock:
+        totals = _totals or _empty_totals()
+        args_totals = dict(totals.args)
+        for name, size in args.items():
+            args_totals[name] = args_totals.get(name, 0) + size
+        _totals = PayloadTotals(
+            totals.calls + 1,
+            args_totals,
+            totals.component + component,
+            totals.css + css,
+            totals.navigation + navigation,
+            totals.total + total,
+        )
+    return sizes
+
+
+def payload_sizes(key=None):
+    """
+    Get the sizes of the payloads added by the last call of a navbar.
+
+    It must be called while the app script runs, after ``st_navbar``, and
+    returns the sizes of its call in the current session.
+
+    Parameters
+    ----------
+    key : str or int, optional
+        The key of the navbar.
+
+    Returns
+    -------
+    sizes : PayloadSizes or None
+        A named tuple with the size in bytes of each component argument, by
+        its name, in ``args``, of all of them serialized together in
+        ``component``, of the ``st.html`` blocks with the CSS adjustments in
+        ``css``, of the navigation message in ``navigation``, and their
+        ``total``. It is ``None`` if the navbar was not called yet in the
+        session.
+    """
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None
+    return _last.get(ctx.session_state._state, key).get("sizes")
+
+
+def payload_totals(reset=False):
+    """
+    Get the running totals of the payload sizes of ``st_navbar``.
+
+    Parameters
+    ----------
+    reset : bool, default=False
+        If set to ``True``, the totals are set back to zero after being read.
+
+    Returns
+    -------
+    totals : PayloadTotals
+        A named tuple with the number of ``calls`` of every session of the
+        process, and the sum of their sizes in bytes, with the same fields
+        as ``PayloadSizes``.
+    """
+    global _totals
+
+    with _lock:
+        totals = _totals or _empty_totals()
+        if reset:
+            _totals = None
+    return totals
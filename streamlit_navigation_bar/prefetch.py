@@ -0,0 +1,65 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from streamlit.logger import get_logger
+
+
+_LOGGER = get_logger(__name__)
+
+# The number of hooks that can run at the same time, and the number of hints
+# that can wait for one of them. The hints over it are dropped.
+MAX_WORKERS = 4
+MAX_PENDING = 16
+
+# The pool that runs the prefetch hooks, created on the first hint.
+_pool = None
+_pool_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(MAX_WORKERS + MAX_PENDING)
+
+
+def _run_hook(on_prefetch, page_key):
+    try:
+        on_prefetch(page_key)
+    except Exception:
+        _LOGGER.warning(
+            "The on_prefetch hook failed for the page %r.", page_key, exc_info=True
+        )
+    finally:
+        _slots.release()
+
+
+def submit_prefetch(on_prefetch, page_key):
+    """
+    Run the prefetch hook of a page in a background thread pool.
+
+    The hook runs outside of the script run, so it can not add elements to the
+    app, but it can fill the caches of ``st.cache_data`` and
+    ``st.cache_resource``. Since the hints are only a guess of the next page,
+    they are dropped when the pool is busy, and the errors are logged.
+
+    Parameters
+    ----------
+    on_prefetch : callable
+        The hook, called with the key of the page.
+    page_key : str
+        The key of the page that the user is likely to select.
+
+    Returns
+    -------
+    submitted : bool
+        Whether the hook was submitted, or dropped because the pool is busy.
+    """
+    global _pool
+
+    if not _slots.acquire(blocking=False):
+        return False
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=MAX_WORKERS,
+                thread_name_prefix="st_navbar_prefetch",
+            )
+
+    _pool.submit(_run_hook, on_prefetch, page_key)
+    return True
@@ -0,0 +1,216 @@
+import threading
+import weakref
+from collections import namedtuple
+from pathlib import Path
+
+from streamlit.navigation.page import StreamlitPage
+
+
+MemoInfo = namedtuple("MemoInfo", ["hits", "misses", "sessions"])
+
+
+def fingerprint(value):
+    """
+    Build a hashable and comparable snapshot of an ``st_navbar`` argument.
+
+    Dictionaries and lists are converted to tuples, keeping their order, since
+    it changes how the navbar is displayed. A ``StreamlitPage`` is represented
+    by its page source (the callable or path), title, icon and URL path, as
+    the user script creates a new instance of it on every rerun. Any other
+    value is used as it is.
+
+    Parameters
+    ----------
+    value : object
+        The argument to take the snapshot from.
+
+    Returns
+    -------
+    snapshot : object
+        A value that compares equal to the snapshot of an equivalent argument.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((k, fingerprint(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        if all(type(v) is str for v in value):
+            # The usual list of page titles, which are their own snapshots,
+            # without a call per page.
+            return (list, tuple(value))
+        return (list, tuple(fingerprint(v) for v in value))
+    if isinstance(value, StreamlitPage):
+        return (
+            StreamlitPage,
+            value._page,
+            value._title,
+            value._icon,
+            value._url_path,
+        )
+    if isinstance(value, (str, Path)):
+        return value
+    try:
+        hash(value)
+    except TypeError:
+        # Unhashable values can not be compared in a safe way, so they never
+        # match, and the session always takes the slow path.
+        return object()
+    return value
+
+
+class SessionMemo:
+    """
+    Remember the prepared state of the navbar in each session between reruns.
+
+    The state is stored per session and per navbar key, together with the
+    fingerprint of the arguments used to build it. When a rerun calls
+    ``st_navbar`` with the same arguments, the state is replayed instead of
+    being validated and prepared again.
+
+    Sessions are identified by their ``SessionState`` object, which lives for
+    as long as the session does. Once it is garbage collected, the entries of
+    the session are dropped as well.
+
+    Attributes
+    ----------
+    hits : int
+        The number of lookups that found a state to replay.
+    misses : int
+        The number of lookups that had to prepare the state again.
+
+    Methods
+    -------
+    get(session, key, fingerprint)
+        Get the state remembered for a session and key, if it is still valid.
+    put(session, key, fingerprint, state)
+        Remember the state for a session and key.
+    info()
+        Get the hit and miss counters and the number of sessions.
+    clear()
+        Forget the state of all sessions and reset the counters.
+    """
+
+    def __init__(self):
+        """Instantiate an empty memo."""
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, session, key, fingerprint):
+        """
+        Get the state remembered for a session and key, if it is still valid.
+
+        Parameters
+        ----------
+        session : SessionState
+            The session state object of the current session.
+        key : str, int or None
+            The key of the navbar.
+        fingerprint : object
+            The fingerprint of the arguments of the current call.
+
+        Returns
+        -------
+        state : object or None
+            The remembered state if it was built from the same arguments,
+            otherwise ``None``.
+        """
+        entries = self._sessions.get(id(session))
+        entry = entries.get(key) if entries is not None else None
+
+        with self._lock:
+            if entry is not None and entry[0] == fingerprint:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(self, session, key, fingerprint, state):
+        """
+        Remember the state for a session and key.
+
+        Parameters
+        ----------
+        session : SessionState
+            The session state object of the current session.
+        key : str, int or None
+            The key of the navbar.
+        fingerprint : object
+            The fingerprint of the arguments used to build `state`.
+        state : object
+            The prepared state of the navbar.
+        """
+        session_id = id(session)
+        with self._lock:
+            if session_id not in self._sessions:
+                self._sessions[session_id] = {}
+                weakref.finalize(session, self._sessions.pop, session_id, None)
+            self._sessions[session_id][key] = (fingerprint, state)
+
+    def info(self):
+        """
+        Get the hit and miss counters and the number of sessions.
+
+        Returns
+        -------
+        info : MemoInfo
+            A named tuple with the ``hits``, ``misses`` and ``sessions``
+            fields.
+        """
+        with self._lock:
+            return MemoInfo(self.hits, self.misses, len(self._sessions))
+
+    def clear(self):
+        """Forget the state of all sessions and reset the counters."""
+        with self._lock:
+            self._sessions.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class SessionStore:
+    """
+    Keep a dictionary per session and navbar key, for as long as the session.
+
+    Like ``SessionMemo``, sessions are identified by their ``SessionState``
+    object, and their dictionaries are dropped once it is garbage collected.
+
+    Methods
+    -------
+    get(session, key)
+        Get the dictionary of a session and key, creating it if needed.
+    clear()
+        Drop the dictionaries of all sessions.
+    """
+
+    def __init__(self):
+        """Instantiate an empty store."""
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get(self, session, key):
+        """
+        Get the dictionary of a session and key, creating it if needed.
+
+        Parameters
+        ----------
+        session : SessionState
+            The session state object of the current session.
+        key : str, int or None
+            The key of the navbar.
+
+        Returns
+        -------
+        store : dict
+            The dictionary kept for the session and key.
+        """
+        session_id = id(session)
+        with self._lock:
+            if session_id not in self._sessions:
+                self._sessions[session_id] = {}
+                weakref.finalize(session, self._sessions.pop, session_id, None)
+            return self._sessions[session_id].setdefault(key, {})
+
+    def clear(self):
+        """Drop the dictionaries of all sessions."""
+        with self._lock:
+            self._sessions.clear()
@@ -0,0 +1,206 @@
+"""
+Compile the Jinja templates with the CSS adjustments into a Python module.
+
+The templates are parsed by Jinja, with the same environment options used to
+render them, and the parse tree is translated into a plain Python function.
+This way, Jinja is only needed at build time, and the whitespace control of
+the templates is applied by Jinja itself.
+
+Run this file whenever a template changes::
+
+    python streamlit_navigation_bar/templates/compile.py
+"""
+
+import os
+
+from jinja2 import Environment, FileSystemLoader, nodes
+
+
+TEMPLATES_DIR = os.path.dirname(os.path.abspath(__file__))
+MODULE_PATH = os.path.join(os.path.dirname(TEMPLATES_DIR), "compiled_css.py")
+
+# The variables passed to the templates, which become the function parameters.
+PARAMETERS = ["ui", "options", "margin", "key"]
+
+# The line length of the formatter of the repository, which the module follows.
+LINE_LENGTH = 88
+
+HEADER = '''\
+# This file is generated from the Jinja templates in `templates/`, by running
+# `python streamlit_navigation_bar/templates/compile.py`. Do not edit it.
+
+
+class _Undefined:
+    """Represent a missing value, which is rendered as an empty string."""
+
+    def __bool__(self):
+        return False
+
+    def __str__(self):
+        return ""
+
+
+_undefined = _Undefined()
+
+
+def _getattr(obj, attribute):
+    """Get an attribute or, if there is not one, an item, like Jinja does."""
+    try:
+        return getattr(obj, attribute)
+    except AttributeError:
+        pass
+    try:
+        return obj[attribute]
+    except (TypeError, LookupError):
+        return _undefined
+
+
+def _getitem(obj, item):
+    """Get an item or, if there is not one, an attribute, like Jinja does."""
+    try:
+        return obj[item]
+    except (TypeError, LookupError):
+        pass
+    try:
+        return getattr(obj, item)
+    except AttributeError:
+        return _undefined
+'''
+
+
+def literal(value):
+    """Write a constant like the formatter does, preferring double quotes."""
+    source = repr(value)
+    if isinstance(value, str) and source.startswith("'") and '"' not in value:
+        source = '"' + source[1:-1].replace("\\'", "'") + '"'
+    return source
+
+
+def load_env(path=TEMPLATES_DIR):
+    """Load the Jinja environment used to render the templates."""
+    loader = FileSystemLoader(path)
+    return Environment(loader=loader, trim_blocks=True, lstrip_blocks=True)
+
+
+def parse(env, name):
+    """Parse a template into its Jinja tree."""
+    source = env.loader.get_source(env, name)[0]
+    return env.parse(source, name)
+
+
+class Compiler:
+    """
+    Translate the tree of a Jinja template into the body of a Python function.
+
+    Only the subset of Jinja used by the templates is supported: text,
+    variables with attributes and items, ``if`` statements with ``not``,
+    blocks and template inheritance.
+    """
+
+    def __init__(self, env):
+        self.env = env
+        self.lines = []
+        self.blocks = {}
+
+    def compile(self, name):
+        """Compile a template, returning the source code of its function."""
+        template = parse(self.env, name)
+        self.lines = []
+        self.blocks = {}
+        self.write(1, "out = []")
+        self.visit_template(template)
+        self.write(1, 'return "".join(out)')
+        return "\n".join(self.lines)
+
+    def write(self, level, line):
+        self.lines.append("    " * level + line)
+
+    def write_append(self, level, value):
+        """Write a call to `out.append`, split like the formatter does."""
+        line = f"out.append({value})"
+        if len("    " * level + line) <= LINE_LENGTH:
+            self.write(level, line)
+        else:
+            self.write(level, "out.append(")
+            self.write(level + 1, value)
+            self.write(level, ")")
+
+    def visit_template(self, template):
+        """Visit a template, following the templates that it extends."""
+        body = template.body
+        for i, node in enumerate(body):
+            if isinstance(node, nodes.Extends):
+                # The blocks of the child template override the parent's.
+                for block in template.find_all(nodes.Block):
+                    self.blocks.setdefault(block.name, block.body)
+                for child in body[:i]:
+                    self.visit(child, 1)
+                parent = node.template.as_const()
+                self.visit_template(parse(self.env, parent))
+                return
+        self.visit_body(body, 1)
+
+    def visit_body(self, body, level):
+        start = len(self.lines)
+        for node in body:
+            self.visit(node, level)
+        if len(self.lines) == start:
+            self.write(level, "pass")
+
+    def visit(self, node, level):
+        if isinstance(node, nodes.Output):
+            for child in node.nodes:
+                if isinstance(child, nodes.TemplateData):
+                    self.write_append(level, literal(child.data))
+                else:
+                    self.write_append(level, f"str({self.expr(child)})")
+        elif isinstance(node, nodes.If):
+            self.write(level, f"if {self.expr(node.test)}:")
+            self.visit_body(node.body, level + 1)
+            for elif_ in node.elif_:
+                self.write(level, f"elif {self.expr(elif_.test)}:")
+                self.visit_body(elif_.body, level + 1)
+            if node.else_:
+                self.write(level, "else:")
+                self.visit_body(node.else_, level + 1)
+        elif isinstance(node, nodes.Block):
+            for child in self.blocks.get(node.name, node.body):
+                self.visit(child, level)
+        else:
+            raise NotImplementedError(f"Unsupported template node: {node!r}")
+
+    def expr(self, node):
+        if isinstance(node, nodes.Name):
+            if node.name not in PARAMETERS:
+                raise NotImplementedError(f"Unknown template variable: {node.name}")
+            return node.name
+        if isinstance(node, nodes.Const):
+            return literal(node.value)
+        if isinstance(node, nodes.Getattr):
+            return f"_getattr({self.expr(node.node)}, {literal(node.attr)})"
+        if isinstance(node, nodes.Getitem):
+            return f"_getitem({self.expr(node.node)}, {self.expr(node.arg)})"
+        if isinstance(node, nodes.Not):
+            return f"not {self.expr(node.node)}"
+        raise NotImplementedError(f"Unsupported template expression: {node!r}")
+
+
+def compile_module(path=TEMPLATES_DIR):
+    """Compile the templates, returning the source code of the module."""
+    compiler = Compiler(load_env(path))
+    parameters = ", ".join(PARAMETERS)
+    function = (
+        f"\n\ndef render_options_css({parameters}):\n"
+        '    """Render the `options.css` template, which extends `base.css`."""\n'
+        f"{compiler.compile('options.css')}\n"
+    )
+    return HEADER + function
+
+
+def main():
+    with open(MODULE_PATH, "w") as file:
+        file.write(compile_module())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+import bisect
+import functools
+import threading
+import time
+from collections import namedtuple
+
+from streamlit.logger import get_logger
+
+
+_LOGGER = get_logger(__name__)
+
+StageStats = namedtuple(
+    "StageStats", ["count", "total", "mean", "p50", "p90", "p99", "max"]
+)
+
+ClientMeasure = namedtuple("ClientMeasure", ["name", "start", "duration"])
+
+# The upper bounds of the buckets of the histograms, in seconds, from 1 µs to
+# about 4 s, each twice the previous one. The last bucket has no bound.
+BOUNDS = tuple(2**i / 1_000_000 for i in range(23))
+
+_enabled = False
+_sink = None
+_histograms = {}
+_lock = threading.Lock()
+
+
+class Histogram:
+    """
+    Represent the durations of a stage, counted in buckets of growing size.
+
+    The buckets take a fixed amount of memory, whatever the number of
+    durations, and the percentiles are estimated by the upper bound of the
+    bucket where they fall, so they are at most twice the actual value.
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.counts[bisect.bisect_left(BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, fraction):
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(BOUNDS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def stats(self):
+        return StageStats(
+            self.count,
+            self.total,
+            self.total / self.count,
+            self.percentile(0.5),
+            self.percentile(0.9),
+            self.percentile(0.99),
+            self.max,
+        )
+
+
+def record(name, seconds):
+    """Add the duration of a stage to its histogram, and pass it to the sink."""
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.add(seconds)
+        sink = _sink
+    if sink is not None:
+        try:
+            sink(name, seconds)
+        except Exception:
+            _LOGGER.warning("The timing sink failed.", exc_info=True)
+
+
+def client_measures(batch):
+    """
+    Convert a batch of performance measures sent by the frontend.
+
+    Parameters
+    ----------
+    batch : dict
+        The batch, with the ``"measures"`` taken in the iframe of the navbar,
+        each with its ``"name"``, ``"start"`` and ``"duration"`` in
+        milliseconds.
+
+    Returns
+    -------
+    measures : list of ClientMeasure
+        A named tuple for each measure, with its ``name``, and its ``start``,
+        from the start of the iframe, and ``duration`` in seconds.
+    """
+    return [
+        ClientMeasure(
+            measure["name"], measure["start"] / 1000, measure["duration"] / 1000
+        )
+        for measure in batch.get("measures", [])
+    ]
+
+
+class _Stage:
+    """Time the block of a ``with`` statement as a stage of the navbar."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        record(self.name, time.perf_counter() - self.start)
+
+
+class _NoStage:
+    """Do nothing, in place of a stage when the timing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_no_stage = _NoStage()
+
+
+def stage(name):
+    """
+    Time a stage of the navbar, in a ``with`` statement.
+
+    When the timing is disabled, a shared object that does nothing is
+    returned, so the cost is a global lookup and an empty ``with``.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stage.
+    """
+    if not _enabled:
+        return _no_stage
+    return _Stage(name)
+
+
+def timed(name):
+    """Time each call of the decorated function as a stage of the navbar."""
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def enable_timing(sink=None):
+    """
+    Time the stages of ``st_navbar`` in every session of the process.
+
+    The duration of each stage is added to a histogram per stage, which is
+    read with ``timing_stats``. The stages are ``"st_navbar"``, the whole
+    call, and the parts of it: ``"validate"``, the checks of the arguments
+    of every call, ``"validate_spec"``, the checks of the arguments of a new
+    navbar, ``"prepare"``, its payloads, ``"register"``, the pages registered in the app, ``"component"``, the
+    call to the component, ``"adjust_css"``, the CSS adjustments, and
+    ``"navigation"``, the navigation message.
+
+    Parameters
+    ----------
+    sink : callable, optional
+        A function called with the name and the duration in seconds of each
+        stage, as it is timed, to send it somewhere else, such as a metrics
+        client. It is called in the script thread, so it must be fast, and
+        its errors are logged.
+    """
+    global _enabled, _sink
+
+    if sink is not None and not callable(sink):
+        raise TypeError("The timing sink must be callable.")
+    with _lock:
+        _sink = sink
+        _enabled = True
+
+
+def disable_timing():
+    """Stop timing the stages of ``st_navbar``, keeping the histograms."""
+    global _enabled, _sink
+
+    with _lock:
+        _enabled = False
+        _sink = None
+
+
+def timing_stats(reset=False):
+    """
+    Get the statistics of the timed stages of ``st_navbar``.
+
+    Parameters
+    ----------
+    reset : bool, default=False
+        If set to ``True``, the histograms are emptied after being read.
+
+    Returns
+    -------
+    stats : dict of {str : StageStats}
+        A named tuple for each stage, by its name, with the ``count`` of
+        durations and their ``total``, ``mean``, ``p50``, ``p90``, ``p99`` and
+        ``max``, in seconds. The percentiles are estimated from the histogram,
+        at most twice the actual value.
+    """
+    global _histograms
+
+    with _lock:
+        stats = {name: histogram.stats() for name, histogram in _histograms.items()}
+        if reset:
+            _histograms = {}
+    return stats
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import glob
+import gzip
+import os
+
+import pytest
+
+
+DIST_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "streamlit_navigation_bar",
+    "frontend",
+    "dist",
+)
+
+# The most bytes of gzipped JavaScript that each mount of the component can
+# download. The 3.3.0 release shipped 67.5 kB.
+JS_BUDGET = 64 * 1024
+
+
+def built_assets(pattern):
+    paths = glob.glob(os.path.join(DIST_DIR, "assets", pattern))
+    if not paths:
+        pytest.skip("The frontend is not built, run `npm run build` first.")
+    return paths
+
+
+def test_gzipped_js_is_within_budget():
+    size = 0
+    for path in built_assets("*.js"):
+        with open(path, "rb") as file:
+            size += len(gzip.compress(file.read(), compresslevel=9))
+    assert size <= JS_BUDGET, f"{size} bytes of gzipped JS, over {JS_BUDGET}"
+
+
+def test_assets_are_precompressed():
+    for path in built_assets("*.js") + built_assets("*.css"):
+        assert os.path.exists(f"{path}.br"), path
+        assert os.path.exists(f"{path}.gz"), path
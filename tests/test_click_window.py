@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import json
+
+from streamlit.testing.v1 import AppTest
+
+
+def app(click_window):
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    page = st_navbar(["Home", "Reports"], click_window=click_window)
+    st.write(page)
+
+
+def test_click_window_is_sent_to_the_component():
+    at = AppTest.from_function(app, kwargs={"click_window": 300})
+    at.run()
+    assert not at.exception
+    args = json.loads(at.get("component_instance")[0].proto.json_args)
+    assert args["click_window"] == 300
+    assert args["allow_reselect"] is False
+
+
+def test_invalid_click_window():
+    for click_window in [-1, 0.5, True]:
+        at = AppTest.from_function(app, kwargs={"click_window": click_window})
+        at.run()
+        assert "click_window" in at.exception[0].message
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from time import sleep
+
+
+import pytest
+
+from playwright.sync_api import Page, expect
+
+LOCAL_TEST = False
+
+PORT = "8503" if LOCAL_TEST else "8699"
+
+APP = """
+import streamlit as st
+from streamlit_navigation_bar import st_navbar
+
+st.session_state.runs = st.session_state.get("runs", 0) + 1
+page = st_navbar(["Home", "Install", "API"], click_window=500, key="nav")
+st.header(page)
+st.write(f"Runs: {st.session_state.runs}")
+"""
+
+NAVBAR = 'internal:attr=[title="streamlit_navigation_bar.st_navbar"]'
+
+
+@contextmanager
+def run_streamlit(example_app):
+    """Run the streamlit app at `example_app` on port `PORT`"""
+    import subprocess
+
+    if LOCAL_TEST:
+        try:
+            yield 1
+        finally:
+            pass
+    else:
+        p = subprocess.Popen(
+            [
+                "streamlit",
+                "run",
+                example_app,
+                "--server.port",
+                PORT,
+                "--server.headless",
+                "true",
+            ]
+        )
+
+        sleep(5)
+
+        try:
+            yield 1
+        finally:
+            p.kill()
+
+
+@pytest.fixture
+def app_path(tmp_path):
+    path = tmp_path / "streamlit_app.py"
+    path.write_text(APP)
+    return str(path)
+
+
+def test_clicks_within_the_window_make_one_run(page: Page, app_path):
+    with run_streamlit(app_path):
+        page.goto(f"localhost:{PORT}")
+        page.set_viewport_size({"width": 700, "height": 700})
+        expect.set_options(timeout=5_000)
+        sleep(1)
+
+        navbar = page.frame_locator(NAVBAR)
+        expect(page.get_by_text("Runs: 1")).to_be_visible()
+
+        # Both clicks are well within the window of 500 ms.
+        navbar.get_by_role("link", name="Install").click()
+        navbar.get_by_role("link", name="API").click()
+
+        # Only the last selection is sent, when the window ends.
+        expect(page.get_by_role("heading", name="API")).to_be_visible()
+        expect(page.get_by_text("Runs: 2")).to_be_visible()
+        sleep(1)
+        assert page.get_by_text("Runs: 3").count() == 0
+        assert page.get_by_role("heading", name="Install").count() == 0
+
+        # A click after the window ends makes a run of its own.
+        navbar.get_by_role("link", name="Home").click()
+        expect(page.get_by_role("heading", name="Home")).to_be_visible()
+        expect(page.get_by_text("Runs: 3")).to_be_visible()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+
+from streamlit.testing.v1 import AppTest
+
+
+BATCH = {
+    "id": "1700000000000.5:1",
+    "measures": [
+        {"name": "first-paint", "start": 0, "duration": 250.0},
+        {"name": "click", "start": 1200.0, "duration": 3.5},
+    ],
+}
+
+
+def app(perf):
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    def on_perf(measures):
+        st.session_state.setdefault("measures", []).extend(measures)
+
+    page = st_navbar(["Home", "Reports"], on_perf=on_perf if perf else None, key="nav")
+    st.write(page)
+
+
+def test_perf_is_only_requested_with_a_callback():
+    for perf in [True, False]:
+        at = AppTest.from_function(app, kwargs={"perf": perf})
+        at.run()
+        args = json.loads(at.get("component_instance")[0].proto.json_args)
+        assert args["perf"] is perf
+
+
+def test_measures_are_reported_once():
+    at = AppTest.from_function(app, kwargs={"perf": True})
+    at.run()
+    at.session_state["nav"] = ["reports", None, {"perf": BATCH}]
+    at.run()
+    assert not at.exception
+    assert at.markdown[0].value == "Reports"
+    measures = at.session_state["measures"]
+    assert [measure.name for measure in measures] == ["first-paint", "click"]
+    assert measures[0].duration == 0.25
+    assert measures[1].start == 1.2
+
+    # A rerun that the value did not cause does not report it again.
+    at.run()
+    assert len(at.session_state["measures"]) == 2
+
+
+def test_invalid_on_perf():
+    def app():
+        from streamlit_navigation_bar import st_navbar
+
+        st_navbar(["Home", "Reports"], on_perf="callback")
+
+    at = AppTest.from_function(app)
+    at.run()
+    assert "on_perf" in at.exception[0].message
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import itertools
+import os
+import runpy
+
+import pytest
+from jinja2 import Environment, FileSystemLoader
+
+from streamlit_navigation_bar.compiled_css import render_options_css
+
+
+TEMPLATES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "streamlit_navigation_bar",
+    "templates",
+)
+
+OPTIONS = [
+    "show_menu",
+    "show_sidebar",
+    "hide_nav",
+    "fix_shadow",
+    "use_padding",
+    "sidebar_under_navbar",
+]
+
+
+class UI:
+    height = "3rem"
+    hover_bg_color = "transparent"
+    color = "white"
+    bg_color = "royalblue"
+    hover_color = "rgb(49, 51, 63)"
+
+    def __init__(self, theme):
+        self.theme = theme
+
+
+@pytest.mark.parametrize("theme", [None, {"backgroundColor": "#ffffff"}])
+def test_compiled_css_matches_jinja(theme):
+    loader = FileSystemLoader(TEMPLATES_DIR)
+    env = Environment(loader=loader, trim_blocks=True, lstrip_blocks=True)
+    template = env.get_template("options.css")
+    ui = UI(theme)
+
+    for toggles in itertools.product([True, False], repeat=len(OPTIONS)):
+        options = dict(zip(OPTIONS, toggles))
+        margin = options["show_menu"] or options["show_sidebar"]
+        kwargs = {"ui": ui, "options": options, "margin": margin, "key": "key"}
+
+        assert render_options_css(**kwargs) == template.render(**kwargs)
+
+
+def test_compiled_css_is_up_to_date():
+    compiler = runpy.run_path(os.path.join(TEMPLATES_DIR, "compile.py"))
+    with open(compiler["MODULE_PATH"]) as file:
+        assert (
+            file.read() == compiler["compile_module"]()
+        ), "The templates changed, run templates/compile.py to compile them"
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+
+from streamlit.testing.v1 import AppTest
+
+
+HEAVY_ARGS = [
+    "left",
+    "right",
+    "styles",
+    "css",
+    "links",
+    "base64_svg",
+    "base64_icon_font",
+]
+
+
+def app(key, color="royalblue"):
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    page = st_navbar(
+        ["Home", "Examples", "Community"],
+        right=["GitHub"],
+        styles={"nav": {"background-color": color}},
+        key=key,
+    )
+    st.write(page)
+
+
+def component_args(at):
+    return json.loads(at.get("component_instance")[0].proto.json_args)
+
+
+def test_heavy_args_are_sent_once_per_session():
+    at = AppTest.from_function(app, kwargs={"key": "nav"})
+    at.run()
+    first = component_args(at)
+    assert all(name in first for name in HEAVY_ARGS)
+    assert set(first["hashes"]) == set(HEAVY_ARGS)
+
+    at.run()
+    second = component_args(at)
+    assert not any(name in second for name in HEAVY_ARGS)
+    assert second["hashes"] == first["hashes"]
+
+    # A new session gets the arguments in full.
+    other = AppTest.from_function(app, kwargs={"key": "nav"})
+    other.run()
+    assert all(name in component_args(other) for name in HEAVY_ARGS)
+
+
+def test_only_changed_args_are_sent_again():
+    at = AppTest.from_function(app, kwargs={"key": "nav"})
+    at.run()
+    at.session_state["nav"] = ["examples", None]
+    at.run()
+    assert not at.exception
+    assert at.markdown[0].value == "Examples"
+    assert not any(name in component_args(at) for name in HEAVY_ARGS)
+
+    at.kwargs["color"] = "tomato"
+    at.run()
+    args = component_args(at)
+    assert args["styles"] == {"nav": {"background-color": "tomato"}}
+    assert not any(name in args for name in HEAVY_ARGS if name != "styles")
+
+
+def test_args_are_sent_in_full_without_a_key():
+    at = AppTest.from_function(app, kwargs={"key": None})
+    for _ in range(2):
+        at.run()
+        args = component_args(at)
+        assert all(name in args for name in HEAVY_ARGS)
+        assert "hashes" not in args
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from time import sleep
+
+
+import pytest
+
+from playwright.sync_api import Page, expect
+
+LOCAL_TEST = False
+
+PORT = "8503" if LOCAL_TEST else "8699"
+
+# Record the heights that the components send to the app.
+COUNT_FRAME_HEIGHTS = """
+window.frameHeights = [];
+window.addEventListener("message", (event) => {
+  if (event.data && event.data.type === "streamlit:setFrameHeight") {
+    window.frameHeights.push(event.data.height);
+  }
+});
+"""
+
+
+@contextmanager
+def run_streamlit(example_app):
+    """Run the streamlit app at `example_app` on port `PORT`"""
+    import subprocess
+
+    if LOCAL_TEST:
+        try:
+            yield 1
+        finally:
+            pass
+    else:
+        p = subprocess.Popen(
+            [
+                "streamlit",
+                "run",
+                example_app,
+                "--server.port",
+                PORT,
+                "--server.headless",
+                "true",
+            ]
+        )
+
+        sleep(5)
+
+        try:
+            yield 1
+        finally:
+            p.kill()
+
+
+@pytest.mark.parametrize("index", [3])
+def test_frame_height_messages_per_navigation(page: Page, index):
+    i = index
+    with run_streamlit(f"examples/st_navbar_{i}/streamlit_app.py"):
+        page.add_init_script(COUNT_FRAME_HEIGHTS)
+        page.goto(f"localhost:{PORT}")
+        page.set_viewport_size({"width": 700, "height": 700})
+        expect.set_options(timeout=5_000)
+        sleep(1)
+
+        # The height of the first render is sent.
+        heights = page.evaluate("window.frameHeights")
+        assert heights
+
+        for title in ["Install", "User Guide", "API", "Examples", "Community"]:
+            before = page.evaluate("window.frameHeights.length")
+            page.frame_locator(
+                'internal:attr=[title="streamlit_navigation_bar.st_navbar"]'
+            ).get_by_role("link", name=title).click()
+            expect(page.get_by_role("heading", name=title)).to_be_visible()
+            sleep(0.5)
+
+            # The navbar keeps its height, so no message is sent again.
+            after = page.evaluate("window.frameHeights.length")
+            assert after == before
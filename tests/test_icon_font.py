@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import glob
+import importlib
+import json
+import os
+import re
+
+from streamlit.testing.v1 import AppTest
+
+from streamlit_navigation_bar.icon_font import FONT_STYLESHEET, icon_font, load_font
+from streamlit_navigation_bar.lru_cache import LRUCache
+
+# The module, which the function of the same name hides in the package.
+icon_font_module = importlib.import_module("streamlit_navigation_bar.icon_font")
+
+
+FRONTEND_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "streamlit_navigation_bar",
+    "frontend",
+)
+
+
+def app(icons):
+    from streamlit_navigation_bar import st_navbar
+
+    st_navbar(["Home", "Settings", "About"], icons=icons, key="nav")
+
+
+def component_args(at):
+    return json.loads(at.get("component_instance")[0].proto.json_args)
+
+
+def test_no_font_is_loaded_without_icons():
+    at = AppTest.from_function(app, kwargs={"icons": None})
+    at.run()
+    args = component_args(at)
+    assert args["icon_font_url"] is None
+    assert args["base64_icon_font"] is None
+
+
+def test_font_is_subset_to_the_icons():
+    load_font(wait=True)
+    icons = {"Home": ":material/home:", "Settings": ":material/settings:"}
+    at = AppTest.from_function(app, kwargs={"icons": icons})
+    at.run()
+    assert not at.exception
+    args = component_args(at)
+
+    assert args["icon_font_url"].endswith(".woff2")
+    assert args["base64_icon_font"] is None
+
+    # The subset only has two glyphs, instead of the thousands of the font.
+    font = icon_font(["home", "settings"])
+    assert font.data.startswith(b"wOF2")
+    assert len(font.data) < 5_000
+    assert set(font.glyphs) == {"home", "settings"}
+    home, settings, about = args["left"]
+    assert len(home["icon"]) == 1 and len(settings["icon"]) == 1
+    assert about["icon"] is None
+
+
+def test_no_external_requests_are_made():
+    load_font(wait=True)
+    at = AppTest.from_function(app, kwargs={"icons": {"Home": ":material/home:"}})
+    at.run()
+    assert not re.search(r"https?://", at.get("component_instance")[0].proto.json_args)
+
+    paths = glob.glob(os.path.join(FRONTEND_DIR, "src", "**", "*.vue"), recursive=True)
+    paths.append(os.path.join(FRONTEND_DIR, "index.html"))
+    for path in paths:
+        with open(path) as file:
+            source = file.read()
+        assert not re.search(r"(href|src)=\"https?://", source), path
+        assert "fonts.googleapis.com" not in source, path
+
+
+def test_stylesheet_is_linked_until_the_font_is_read(monkeypatch):
+    monkeypatch.setattr(icon_font_module, "load_font", lambda wait=False: None)
+    monkeypatch.setattr(icon_font_module, "_subsets", LRUCache(maxsize=32))
+    font = icon_font(["search"])
+    assert font.data is None
+    assert font.glyphs == {}
+
+    # The navbars prepared once the font was read are not reused.
+    monkeypatch.setattr("streamlit_navigation_bar.font_ready", lambda: False)
+    at = AppTest.from_function(app, kwargs={"icons": {"Home": ":material/home:"}})
+    at.run()
+    args = component_args(at)
+    assert args["icon_font_url"] is None
+    assert args["base64_icon_font"] is None
+    assert args["links"] == [FONT_STYLESHEET]
+    # The icon is rendered by the ligature of its name.
+    assert args["left"][0]["icon"] == "home"
+
+    # The stylesheet is not cached, so the subset is used once it is read.
+    monkeypatch.undo()
+    load_font(wait=True)
+    assert set(icon_font(["search"]).glyphs) == {"search"}
+
+
+def test_font_that_can_not_be_decoded_is_not_subset(monkeypatch):
+    def decode(file):
+        raise ImportError("No module named 'brotli'")
+
+    monkeypatch.setattr(icon_font_module, "TTFont", decode)
+    assert icon_font_module._read_font() == (None, {})
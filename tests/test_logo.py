@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import json
+import os
+
+from streamlit.testing.v1 import AppTest
+
+
+LOGO_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "examples",
+    "st_navbar_10",
+    "cubes.svg",
+)
+
+
+def app(logo_path):
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    page = st_navbar(["Docs", "Examples"], logo_path=logo_path)
+    st.write(page)
+
+
+def test_logo_is_served_as_a_media_file():
+    at = AppTest.from_function(app, kwargs={"logo_path": LOGO_PATH})
+    urls = set()
+    for _ in range(2):
+        at.run()
+        assert not at.exception
+        args = json.loads(at.get("component_instance")[0].proto.json_args)
+        assert args["base64_svg"] is None
+        urls.add(args["logo_url"])
+
+    # The URL is a hash of the contents, so it is the same on every rerun.
+    assert len(urls) == 1
+    assert urls.pop().endswith(".svg")
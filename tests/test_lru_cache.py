@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from streamlit.testing.v1 import AppTest
+
+from streamlit_navigation_bar import css_cache_info
+from streamlit_navigation_bar.lru_cache import LRUCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.info() == (3, 1, 1, 2, 2)
+
+
+def app(key):
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    page = st_navbar(["Home", "Examples"], key=key)
+    st.write(page)
+
+
+def test_css_is_rendered_once_for_the_same_values():
+    before = css_cache_info()
+    for _ in range(2):
+        at = AppTest.from_function(app, kwargs={"key": "css_cache"})
+        at.run()
+        at.run()
+        assert not at.exception
+    after = css_cache_info()
+
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == 3
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from streamlit.testing.v1 import AppTest
+
+from streamlit_navigation_bar.match_navbar import MatchNavbar
+
+
+def test_theme_values_are_css_variables_with_fallbacks():
+    ui = MatchNavbar({"span": {"color": "var(--text-color)"}})
+
+    value = ui.get_value(
+        css_property="background-color",
+        targets=["nav"],
+        default="rgb(240, 242, 246)",
+        theme_config="secondaryBackgroundColor",
+    )
+    assert value.startswith("var(--st-navbar-secondary-background-color")
+    assert value.endswith("rgb(240, 242, 246))")
+
+    value = ui.get_value(css_property="color", targets=["span"], default="red")
+    assert value.startswith("var(--st-navbar-text-color")
+
+    assert ui.get_value("height", ["nav"], "2.875rem") == "2.875rem"
+
+
+def app():
+    from streamlit_navigation_bar import st_navbar
+
+    st_navbar(["Home", "Examples"])
+
+
+def test_navbar_mounts_a_single_component():
+    at = AppTest.from_function(app)
+    at.run()
+    assert not at.exception
+
+    assert len(at.get("component_instance")) == 1
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from streamlit_navigation_bar import memo_info
+
+
+def app(**kwargs):
+    import streamlit as st
+    from streamlit_navigation_bar import NavbarSpec, st_navbar
+
+    @st.cache_resource
+    def navbar_spec():
+        return NavbarSpec(["Home", "Examples", "Community"], right=["GitHub"])
+
+    spec = navbar_spec()
+    st.session_state.spec_id = id(spec)
+    page = st_navbar(spec, key="nav", **kwargs)
+    st.write(page)
+
+
+def test_spec_is_shared_between_sessions():
+    before = memo_info()
+    first = AppTest.from_function(app)
+    second = AppTest.from_function(app)
+    first.run()
+    second.run()
+    assert not first.exception and not second.exception
+    assert first.session_state.spec_id == second.session_state.spec_id
+    assert memo_info().misses == before.misses
+
+    second.session_state["nav"] = ["github", None]
+    second.run()
+    assert first.markdown[0].value == "Home"
+    assert second.markdown[0].value == "GitHub"
+
+
+def test_spec_rejects_the_arguments_that_describe_the_navbar():
+    at = AppTest.from_function(app, kwargs={"logo_page": "Start"})
+    at.run()
+    assert "NavbarSpec" in at.exception[0].message
+
+
+def test_spec_is_immutable():
+    from streamlit_navigation_bar import NavbarSpec
+
+    spec = NavbarSpec.__new__(NavbarSpec)
+    with pytest.raises(AttributeError):
+        spec.default = "examples"
+    with pytest.raises(AttributeError):
+        spec.anything = None
+
+
+def test_spec_needs_a_running_script():
+    from streamlit.errors import StreamlitAPIException
+
+    from streamlit_navigation_bar import NavbarSpec
+
+    with pytest.raises(StreamlitAPIException):
+        NavbarSpec(["Home"])
+
+
+def pages_app():
+    import streamlit as st
+    from streamlit_navigation_bar import NavbarSpec, st_navbar
+
+    def home():
+        pass
+
+    @st.cache_resource
+    def navbar_spec():
+        return NavbarSpec([st.Page(home, title="Home")], styles={"nav": {}})
+
+    spec = navbar_spec()
+    page = st_navbar(spec, key="nav")
+    page.run()
+    st.session_state.copied = page is not spec.pages[0]
+    st.session_state.shared_called = spec.pages[0]._can_be_called
+    try:
+        spec.styles["nav"] = {"background-color": "red"}
+    except TypeError:
+        st.session_state.frozen = True
+
+
+def test_spec_pages_are_copied_for_each_session():
+    at = AppTest.from_function(pages_app)
+    at.run()
+    assert not at.exception
+    assert at.session_state.copied
+    assert not at.session_state.shared_called
+    assert at.session_state.frozen
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+import pytest
+from streamlit.runtime.pages_manager import PagesManager
+from streamlit.runtime.scriptrunner_utils.script_run_context import (
+    ScriptRunContext,
+)
+from streamlit.testing.v1 import AppTest
+from streamlit.util import calc_md5
+
+
+def app(set_path):
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    pages = [f"Page {i}" for i in range(60)]
+    page = st_navbar(pages, set_path=set_path, key="nav")
+    st.write(page)
+
+
+def run_app(reruns, set_path):
+    """Run the app in a single session and return the navigation messages."""
+    messages = []
+    enqueue = ScriptRunContext.enqueue
+
+    def record(ctx, msg):
+        if msg.WhichOneof("type") == "navigation":
+            messages.append(msg)
+        enqueue(ctx, msg)
+
+    at = AppTest.from_function(app, kwargs={"set_path": set_path})
+    # A real session keeps its pages manager between reruns.
+    pages_manager = PagesManager(at._script_path, setup_watcher=False)
+    with mock.patch.object(ScriptRunContext, "enqueue", record), mock.patch(
+        "streamlit.testing.v1.app_test.PagesManager", return_value=pages_manager
+    ):
+        for _ in range(reruns):
+            at.run()
+            assert not at.exception
+            assert at.markdown[0].value == "Page 0"
+    return messages
+
+
+@pytest.mark.parametrize("reruns", [1, 5])
+def test_all_pages_are_sent_on_every_run(reruns):
+    messages = run_app(reruns, set_path=False)
+
+    # Streamlit's frontend replaces its pages with the ones of each message,
+    # so they are all sent every time.
+    assert len(messages) == reruns
+    for msg in messages:
+        assert len(msg.navigation.app_pages) == 60
+        assert msg.navigation.app_pages[0].is_default
+        assert (
+            msg.navigation.page_script_hash
+            == msg.navigation.app_pages[0].page_script_hash
+        )
+
+
+def test_all_pages_are_sent_with_set_path():
+    messages = run_app(3, set_path=True)
+
+    assert [len(msg.navigation.app_pages) for msg in messages] == [60, 60, 60]
+    for msg in messages:
+        selected = msg.navigation.app_pages[0]
+        assert msg.navigation.page_script_hash == selected.page_script_hash
+
+
+def deep_link_app():
+    from streamlit_navigation_bar import st_navbar
+
+    st_navbar(["Home", "Install", "API"], set_path=True, key="nav")
+
+
+def test_root_page_is_the_default_page_after_a_deep_link():
+    at = AppTest.from_function(deep_link_app)
+    at.run()
+    args = json.loads(at.get("component_instance")[0].proto.json_args)
+    assert args["root_page"] == "home"
+
+    # Open the app at the URL of another page.
+    at._page_hash = calc_md5("install")
+    at.run()
+    assert not at.exception
+    args = json.loads(at.get("component_instance")[0].proto.json_args)
+    assert args["default"][0] == "install"
+    assert args["root_page"] == "home"
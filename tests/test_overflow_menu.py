@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from time import sleep
+
+
+import pytest
+
+from playwright.sync_api import Page, expect
+
+LOCAL_TEST = False
+
+PORT = "8503" if LOCAL_TEST else "8699"
+
+# A navbar with more pages than fit in the width of the window.
+APP = """
+import streamlit as st
+from streamlit_navigation_bar import st_navbar
+
+page = st_navbar([f"Page {i}" for i in range(300)], key="nav")
+st.header(page)
+"""
+
+# A navbar whose left and right parts both have more pages than fit.
+BOTH_PARTS_APP = """
+import streamlit as st
+from streamlit_navigation_bar import st_navbar
+
+page = st_navbar(
+    [f"Page {i}" for i in range(100)],
+    right=[f"Right {i}" for i in range(100)],
+    key="nav",
+)
+st.header(page)
+"""
+
+NAVBAR = 'internal:attr=[title="streamlit_navigation_bar.st_navbar"]'
+
+
+@contextmanager
+def run_streamlit(example_app):
+    """Run the streamlit app at `example_app` on port `PORT`"""
+    import subprocess
+
+    if LOCAL_TEST:
+        try:
+            yield 1
+        finally:
+            pass
+    else:
+        p = subprocess.Popen(
+            [
+                "streamlit",
+                "run",
+                example_app,
+                "--server.port",
+                PORT,
+                "--server.headless",
+                "true",
+            ]
+        )
+
+        sleep(5)
+
+        try:
+            yield 1
+        finally:
+            p.kill()
+
+
+@pytest.mark.parametrize("width", [700, 1200])
+def test_pages_that_do_not_fit_go_to_the_more_menu(page: Page, tmp_path, width):
+    app = tmp_path / "streamlit_app.py"
+    app.write_text(APP)
+    with run_streamlit(str(app)):
+        page.goto(f"localhost:{PORT}")
+        page.set_viewport_size({"width": width, "height": 700})
+        expect.set_options(timeout=5_000)
+        sleep(1)
+
+        navbar = page.frame_locator(NAVBAR)
+        # Only the pages that fit are in the bar, with the "More" menu.
+        in_bar = navbar.locator("ul.navbar-list > li.navbar-item").count()
+        assert 1 < in_bar < 300
+        more = navbar.get_by_role("link", name="More")
+        expect(more).to_be_visible()
+
+        # The menu only mounts the rows in view, not the hidden pages.
+        more.click()
+        rows = navbar.locator(".navbar-dropdown li")
+        expect(rows.first).to_be_visible()
+        assert rows.count() < 30
+
+        navbar.locator(".navbar-dropdown").evaluate(
+            "(menu) => menu.scrollTo(0, menu.scrollHeight)"
+        )
+        navbar.get_by_role("link", name="Page 299").click()
+        expect(page.get_by_role("heading", name="Page 299")).to_be_visible()
+
+
+def pages_in_bar(navbar, part):
+    """Count the pages in a part of the bar, without the logo and "More"."""
+    return navbar.locator(
+        f"div.navbar-{part} li.navbar-item:not([data-key^='#'])"
+    ).count()
+
+
+def resize(page, width):
+    page.set_viewport_size({"width": width, "height": 700})
+    # The layout is computed in the next animation frame after the resize.
+    sleep(1)
+
+
+def test_pages_come_back_from_the_more_menu_when_widening(page: Page, tmp_path):
+    app = tmp_path / "streamlit_app.py"
+    app.write_text(APP)
+    with run_streamlit(str(app)):
+        page.goto(f"localhost:{PORT}")
+        resize(page, 1200)
+        expect.set_options(timeout=5_000)
+
+        navbar = page.frame_locator(NAVBAR)
+        wide = pages_in_bar(navbar, "left")
+        assert 1 < wide < 300
+
+        resize(page, 700)
+        narrow = pages_in_bar(navbar, "left")
+        assert 1 <= narrow < wide
+        last = navbar.get_by_role("link", name=f"Page {wide - 1}", exact=True)
+        expect(last).to_have_count(0)
+
+        # The same pages are back in the bar, and out of the menu.
+        resize(page, 1200)
+        assert pages_in_bar(navbar, "left") == wide
+        expect(last).to_be_visible()
+        navbar.get_by_role("link", name="More").click()
+        rows = navbar.locator(".navbar-dropdown li")
+        expect(rows.first).to_contain_text(f"Page {wide}")
+
+
+def test_both_parts_share_the_width_of_the_bar(page: Page, tmp_path):
+    app = tmp_path / "streamlit_app.py"
+    app.write_text(BOTH_PARTS_APP)
+    with run_streamlit(str(app)):
+        page.goto(f"localhost:{PORT}")
+        resize(page, 1200)
+        expect.set_options(timeout=5_000)
+
+        navbar = page.frame_locator(NAVBAR)
+        left = pages_in_bar(navbar, "left")
+        right = pages_in_bar(navbar, "right")
+        assert 1 <= left < 100 and 1 <= right < 100
+        expect(navbar.get_by_role("link", name="More")).to_have_count(2)
+
+        # Both parts fit in the bar, without overflowing it or each other.
+        nav = navbar.locator("nav").bounding_box()
+        for part in ["left", "right"]:
+            items = navbar.locator(f"div.navbar-{part} li.navbar-item")
+            first = items.first.bounding_box()
+            last = items.last.bounding_box()
+            assert nav["x"] <= first["x"]
+            assert last["x"] + last["width"] <= nav["x"] + nav["width"]
+        left_end = navbar.locator("div.navbar-left li.navbar-item").last
+        right_start = navbar.locator("div.navbar-right li.navbar-item").first
+        left_box = left_end.bounding_box()
+        assert left_box["x"] + left_box["width"] <= right_start.bounding_box()["x"]
+
+        resize(page, 700)
+        assert pages_in_bar(navbar, "left") < left
+        assert pages_in_bar(navbar, "right") < right
+
+        resize(page, 1200)
+        assert pages_in_bar(navbar, "left") == left
+        assert pages_in_bar(navbar, "right") == right
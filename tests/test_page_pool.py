@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from streamlit.testing.v1 import AppTest
+
+
+def app():
+    import streamlit as st
+    from streamlit_navigation_bar import NavbarSpec, st_navbar
+
+    pages = ["Home", "Reports", "About"]
+    home = NavbarSpec(pages, selected="Home")
+    reports = NavbarSpec(pages, selected="Reports")
+    st.session_state.page_ids = [id(page) for page in home.registry.page_objects]
+    st.session_state.shared = all(
+        a is b
+        for a, b in zip(home.registry.page_objects, reports.registry.page_objects)
+    )
+    st.session_state.defaults = [page._default for page in home.registry.page_objects]
+
+    msg = reports.navigation_msg(reports.default_page._script_hash)
+    st.session_state.is_default = [p.is_default for p in msg.navigation.app_pages]
+
+    page = st_navbar(reports, key="nav")
+    st.write(page)
+
+
+def test_string_pages_are_shared_and_not_changed():
+    first = AppTest.from_function(app)
+    second = AppTest.from_function(app)
+    first.run()
+    second.run()
+    assert not first.exception and not second.exception
+    assert first.markdown[0].value == "Reports"
+
+    # The navbars share the page objects, even with different defaults,
+    # which are tracked by each navbar instead.
+    assert first.session_state.shared
+    assert first.session_state.defaults == [False, False, False]
+    assert first.session_state.is_default == [False, True, False]
+
+    # The same page objects are used in every rerun and session.
+    first.run()
+    assert first.session_state.page_ids == second.session_state.page_ids
+
+
+def large_app():
+    import streamlit as st
+    from streamlit_navigation_bar import NavbarSpec
+
+    spec = NavbarSpec([f"Page {i}" for i in range(1500)])
+    st.session_state.page_ids = [id(page) for page in spec.registry.page_objects]
+
+
+def test_pages_of_a_large_navbar_are_shared():
+    first = AppTest.from_function(large_app)
+    second = AppTest.from_function(large_app)
+    first.run()
+    second.run()
+    assert not first.exception and not second.exception
+    # The pool grows to hold all the pages, instead of evicting the first
+    # ones to add the last ones.
+    assert first.session_state.page_ids == second.session_state.page_ids
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from streamlit_navigation_bar import page_ref
+from streamlit_navigation_bar.page_ref import PageRef, warm_up_pages
+
+
+PAGE = """
+import streamlit as st
+
+
+def show_{name}():
+    st.write("{name}")
+"""
+
+
+@pytest.fixture
+def lazy_pages(tmp_path, monkeypatch):
+    package = tmp_path / "lazy_pages"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    for name in ["alpha", "beta", "gamma"]:
+        (package / f"{name}.py").write_text(PAGE.format(name=name))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield [f"lazy_pages.{name}" for name in ["alpha", "beta", "gamma"]]
+    for module in list(sys.modules):
+        if module.startswith("lazy_pages"):
+            del sys.modules[module]
+
+
+def app(warm_up):
+    from streamlit_navigation_bar import PageRef, st_navbar
+
+    page = st_navbar(
+        [
+            PageRef("lazy_pages.alpha:show_alpha"),
+            PageRef("lazy_pages.beta:show_beta"),
+            PageRef("lazy_pages.gamma:show_gamma"),
+        ],
+        warm_up=warm_up,
+        key="nav",
+    )
+    page.run()
+
+
+def test_pages_are_imported_when_selected(lazy_pages):
+    alpha, beta, gamma = lazy_pages
+    at = AppTest.from_function(app, kwargs={"warm_up": False})
+    at.run()
+    assert not at.exception
+    assert at.markdown[0].value == "alpha"
+    assert alpha in sys.modules
+    assert beta not in sys.modules and gamma not in sys.modules
+
+    at.session_state["nav"] = ["show_beta", None]
+    at.run()
+    assert not at.exception
+    assert at.markdown[0].value == "beta"
+    assert beta in sys.modules
+    assert gamma not in sys.modules
+
+
+def test_warm_up_imports_the_other_pages(lazy_pages):
+    at = AppTest.from_function(app, kwargs={"warm_up": True})
+    at.run()
+    assert not at.exception
+
+    deadline = time.monotonic() + 5
+    while not all(module in sys.modules for module in lazy_pages):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_page_refs_compare_by_reference():
+    assert PageRef("pages.api:show_api") == PageRef("pages.api:show_api")
+    assert PageRef("pages.api:show_api").__name__ == "show_api"
+    with pytest.raises(ValueError):
+        PageRef("pages/api.py")
+
+
+def titles_app():
+    import streamlit as st
+    from streamlit_navigation_bar import PageRef, st_navbar
+
+    page = st_navbar(
+        ["Q1:Summary", "time:series", PageRef("lazy_pages.beta:show_beta")],
+        key="nav",
+    )
+    st.write(page if isinstance(page, str) else page.title)
+
+
+def test_titles_with_a_colon_are_not_page_refs(lazy_pages):
+    at = AppTest.from_function(titles_app)
+    at.run()
+    assert not at.exception
+    assert at.markdown[0].value == "Q1:Summary"
+
+    # The module of the reference can be imported, but a string is a title.
+    at.session_state["nav"] = ["time:series", None]
+    at.run()
+    assert not at.exception
+    assert at.markdown[0].value == "time:series"
+
+    at.session_state["nav"] = ["show_beta", None]
+    at.run()
+    assert not at.exception
+    assert at.markdown[0].value == "show beta"
+
+
+def test_warm_up_waits_for_the_script(lazy_pages, monkeypatch):
+    alpha, beta, gamma = lazy_pages
+    # The pages of the other tests were already submitted in this process.
+    monkeypatch.setattr(page_ref, "_submitted", set())
+    script = threading.Event()
+    thread = threading.Thread(target=script.wait)
+    thread.start()
+    warm_up_pages(
+        [PageRef("lazy_pages.beta:show_beta"), PageRef("lazy_pages.gamma:show_gamma")],
+        after=thread,
+    )
+    time.sleep(0.2)
+    assert beta not in sys.modules and gamma not in sys.modules
+
+    script.set()
+    deadline = time.monotonic() + 5
+    while not (beta in sys.modules and gamma in sys.modules):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from streamlit.testing.v1 import AppTest
+
+
+def app(pages, **kwargs):
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    page = st_navbar(pages, key="nav", **kwargs)
+    st.write(page)
+
+
+def test_selection_is_found_among_many_pages():
+    pages = [f"Page {i}" for i in range(1000)]
+    at = AppTest.from_function(app, kwargs={"pages": pages, "selected": "Page 999"})
+    at.run()
+    assert not at.exception
+    assert at.markdown[0].value == "Page 999"
+
+    at.session_state["nav"] = ["page 500", None]
+    at.run()
+    assert not at.exception
+    assert at.markdown[0].value == "Page 500"
+
+
+def test_duplicate_url_paths_are_rejected():
+    at = AppTest.from_function(app, kwargs={"pages": ["Home", "home"]})
+    at.run()
+    assert "URL pathnames must be unique" in at.exception[0].message
+
+
+def test_unknown_selection_is_rejected():
+    at = AppTest.from_function(app, kwargs={"pages": ["Home", "Reports"]})
+    at.run()
+    at.session_state["nav"] = ["settings", None]
+    at.run()
+    assert "*'settings'*" in at.exception[0].message
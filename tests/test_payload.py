@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+
+from streamlit.testing.v1 import AppTest
+
+from streamlit_navigation_bar import payload_totals
+
+
+def app(key):
+    import streamlit as st
+    from streamlit_navigation_bar import payload_sizes, st_navbar
+
+    st_navbar(
+        ["Home", "Examples", "Community"],
+        styles={"nav": {"background-color": "royalblue"}},
+        css="nav { font-weight: bold; }",
+        key=key,
+    )
+    st.session_state.sizes = payload_sizes(key)
+
+
+def test_sizes_match_the_serialized_payloads():
+    at = AppTest.from_function(app, kwargs={"key": "nav"})
+    at.run()
+    assert not at.exception
+    sizes = at.session_state.sizes
+
+    json_args = at.get("component_instance")[0].proto.json_args
+    assert sizes.component == len(json_args)
+    assert sizes.args["css"] == len(json.dumps("nav { font-weight: bold; }"))
+    html = sum(len(element.proto.body.encode()) for element in at.get("html"))
+    assert sizes.css == html
+    assert sizes.navigation > 0
+    assert sizes.total == sizes.component + sizes.css + sizes.navigation
+
+
+def test_reruns_only_count_what_is_sent():
+    at = AppTest.from_function(app, kwargs={"key": "nav"})
+    at.run()
+    first = at.session_state.sizes
+    at.run()
+    second = at.session_state.sizes
+
+    # The heavy arguments and the pages are only sent on the first run.
+    assert "left" in first.args and "left" not in second.args
+    assert second.component == len(at.get("component_instance")[0].proto.json_args)
+    assert second.component < first.component
+
+
+def test_totals_add_up_the_calls():
+    payload_totals(reset=True)
+    at = AppTest.from_function(app, kwargs={"key": "nav"})
+    at.run()
+    first = at.session_state.sizes
+    at.run()
+    second = at.session_state.sizes
+
+    totals = payload_totals(reset=True)
+    assert totals.calls == 2
+    assert totals.total == first.total + second.total
+    assert totals.args["css"] == first.args["css"]
+    assert payload_totals().calls == 0
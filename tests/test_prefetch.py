@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+import threading
+
+from streamlit.testing.v1 import AppTest
+
+from streamlit_navigation_bar import prefetch
+
+
+def app(on_prefetch):
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    page = st_navbar(["Home", "Reports"], on_prefetch=on_prefetch, key="nav")
+    st.write(page)
+
+
+def test_listener_is_only_placed_with_a_hook():
+    at = AppTest.from_function(app, kwargs={"on_prefetch": None})
+    at.run()
+    assert len(at.get("component_instance")) == 1
+
+    at = AppTest.from_function(app, kwargs={"on_prefetch": print})
+    at.run()
+    assert not at.exception
+    navbar, listener = at.get("component_instance")
+    navbar_args = json.loads(navbar.proto.json_args)
+    listener_args = json.loads(listener.proto.json_args)
+    assert listener_args["listen"] is True
+    assert listener_args["channel"] == navbar_args["prefetch_channel"]
+    assert navbar_args["prefetch_delay"] == 200
+    assert at.markdown[0].value == "Home"
+
+
+def test_hooks_run_in_the_background():
+    done = threading.Event()
+    calls = []
+
+    def on_prefetch(page_key):
+        calls.append((page_key, threading.current_thread().name))
+        done.set()
+
+    assert prefetch.submit_prefetch(on_prefetch, "reports")
+    assert done.wait(5)
+    assert calls[0][0] == "reports"
+    assert calls[0][1].startswith("st_navbar_prefetch")
+
+
+def test_hints_are_dropped_when_the_pool_is_busy():
+    release = threading.Event()
+    slots = prefetch.MAX_WORKERS + prefetch.MAX_PENDING
+    try:
+        submitted = [
+            prefetch.submit_prefetch(lambda key: release.wait(5), "reports")
+            for _ in range(slots + 1)
+        ]
+    finally:
+        release.set()
+    assert submitted == [True] * slots + [False]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+
+from streamlit.testing.v1 import AppTest
+
+
+def app():
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    page = st_navbar(
+        {"": ["Home"], "Reports": ["Sales", "Costs"]},
+        right={"Help": ["FAQ"]},
+        key="nav",
+    )
+    st.write(page)
+
+
+def page_app():
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    page = st_navbar(
+        {
+            "": [st.Page(lambda: None, title="Home", url_path="home")],
+            "Reports": [st.Page(lambda: None, title="Sales", url_path="sales")],
+        },
+        key="nav",
+    )
+    st.write(page.title)
+
+
+def component_args(at):
+    return json.loads(at.get("component_instance")[0].proto.json_args)
+
+
+def test_sections_are_sent_as_dropdowns():
+    at = AppTest.from_function(app)
+    at.run()
+    assert not at.exception
+    args = component_args(at)
+
+    left = args["left"]
+    assert [item["title"] for item in left] == ["Home", "Reports"]
+    assert [item["key"] for item in left[1]["items"]] == ["sales", "costs"]
+    assert "items" not in left[0]
+    assert [item["key"] for item in args["right"][0]["items"]] == ["faq"]
+    assert at.markdown[0].value == "Home"
+
+
+def test_pages_in_sections_can_be_selected():
+    at = AppTest.from_function(app)
+    at.run()
+    at.session_state["nav"] = ["costs", None]
+    at.run()
+    assert not at.exception
+    assert at.markdown[0].value == "Costs"
+
+    at.session_state["nav"] = ["faq", None]
+    at.run()
+    assert at.markdown[0].value == "FAQ"
+
+
+def test_page_objects_in_sections():
+    at = AppTest.from_function(page_app)
+    at.run()
+    at.session_state["nav"] = ["sales", None]
+    at.run()
+    assert not at.exception
+    assert at.markdown[0].value == "Sales"
+
+
+def test_invalid_sections():
+    def app():
+        from streamlit_navigation_bar import st_navbar
+
+        st_navbar({"Reports": "Sales"})
+
+    at = AppTest.from_function(app)
+    at.run()
+    assert "pages" in at.exception[0].message
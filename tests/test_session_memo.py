@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from streamlit.testing.v1 import AppTest
+
+from streamlit_navigation_bar import memo_info
+
+
+def app(styles):
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    page = st_navbar(["Home", "Examples", "Community"], styles=styles, key="nav")
+    st.write(page)
+
+
+def test_unchanged_reruns_replay_the_navbar():
+    before = memo_info()
+    at = AppTest.from_function(app, kwargs={"styles": {"span": {"color": "red"}}})
+    for _ in range(3):
+        at.run()
+        assert not at.exception
+        assert at.markdown[0].value == "Home"
+    after = memo_info()
+
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == 2
+
+
+def test_changed_arguments_prepare_the_navbar_again():
+    before = memo_info()
+    at = AppTest.from_function(app, kwargs={"styles": {"span": {"color": "red"}}})
+    at.run()
+    at.kwargs["styles"] = {"span": {"color": "blue"}}
+    at.run()
+    assert not at.exception
+    after = memo_info()
+
+    assert after.misses - before.misses == 2
+    assert after.hits - before.hits == 0
+
+
+def test_selection_is_returned_on_the_fast_path():
+    at = AppTest.from_function(app, kwargs={"styles": None})
+    at.run()
+    at.session_state["nav"] = ["examples", None]
+    at.run()
+    assert not at.exception
+    assert at.markdown[0].value == "Examples"
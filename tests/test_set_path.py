@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from time import sleep
+
+
+import pytest
+
+from playwright.sync_api import Page, expect
+
+LOCAL_TEST = False
+
+PORT = "8503" if LOCAL_TEST else "8699"
+
+APP = """
+import streamlit as st
+from streamlit_navigation_bar import st_navbar
+
+st.session_state.runs = st.session_state.get("runs", 0) + 1
+page = st_navbar(["Home", "Install", "API"], set_path=True, key="nav")
+st.header(page)
+st.write(f"Runs: {st.session_state.runs}")
+"""
+
+NAVBAR = 'internal:attr=[title="streamlit_navigation_bar.st_navbar"]'
+
+
+@contextmanager
+def run_streamlit(example_app):
+    """Run the streamlit app at examples/streamlit_app.py on port 8599"""
+    import subprocess
+
+    if LOCAL_TEST:
+        try:
+            yield 1
+        finally:
+            pass
+    else:
+        p = subprocess.Popen(
+            [
+                "streamlit",
+                "run",
+                example_app,
+                "--server.port",
+                PORT,
+                "--server.headless",
+                "true",
+            ]
+        )
+
+        sleep(5)
+
+        try:
+            yield 1
+        finally:
+            p.kill()
+
+
+@pytest.fixture
+def app_path(tmp_path):
+    path = tmp_path / "streamlit_app.py"
+    path.write_text(APP)
+    return str(path)
+
+
+def test_set_path_makes_one_run_per_click(page: Page, app_path):
+    with run_streamlit(app_path):
+        page.goto(f"localhost:{PORT}")
+        page.set_viewport_size({"width": 700, "height": 700})
+        expect.set_options(timeout=5_000)
+        sleep(1)
+
+        # Mark the window of the navbar, to check that it is never reloaded.
+        navbar = page.frame_locator(NAVBAR)
+        navbar.locator("body").evaluate("() => { window.mounted = true }")
+        history = page.evaluate("history.length")
+        runs = 1
+
+        for title, path in [("Install", "/install"), ("API", "/api")]:
+            navbar.get_by_role("link", name=title).click()
+            expect(page.get_by_role("heading", name=title)).to_be_visible()
+            runs += 1
+            expect(page.get_by_text(f"Runs: {runs}")).to_be_visible()
+            sleep(1)
+            assert page.evaluate("location.pathname") == path
+            assert page.get_by_text(f"Runs: {runs + 1}").count() == 0
+
+        # Each click pushed a single entry to the history.
+        assert page.evaluate("history.length") == history + 2
+        assert navbar.locator("body").evaluate("() => window.mounted")
+
+        page.go_back()
+        expect(page.get_by_role("heading", name="Install")).to_be_visible()
+        expect(page.get_by_text(f"Runs: {runs + 1}")).to_be_visible()
+        assert page.evaluate("location.pathname") == "/install"
+        assert navbar.locator("body").evaluate("() => window.mounted")
+
+        page.go_forward()
+        expect(page.get_by_role("heading", name="API")).to_be_visible()
+        assert page.evaluate("location.pathname") == "/api"
+
+        # Selecting the default page again goes back to the root of the app,
+        # after navigating away from it.
+        navbar.get_by_role("link", name="Home").click()
+        expect(page.get_by_role("heading", name="Home")).to_be_visible()
+        assert page.evaluate("location.pathname") == "/"
+
+        page.go_back()
+        expect(page.get_by_role("heading", name="API")).to_be_visible()
+        assert page.evaluate("location.pathname") == "/api"
+
+        page.go_forward()
+        expect(page.get_by_role("heading", name="Home")).to_be_visible()
+        assert page.evaluate("location.pathname") == "/"
+        assert navbar.locator("body").evaluate("() => window.mounted")
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from streamlit.runtime.pages_manager import PagesManager
+from streamlit.testing.v1 import AppTest
+
+
+def app():
+    from streamlit_navigation_bar import st_navbar
+
+    st_navbar(["Home", "Reports"])
+
+
+def test_pages_manager_class_is_not_changed():
+    # Streamlit itself switches the default strategy once per process.
+    before = {
+        name: value
+        for name, value in vars(PagesManager).items()
+        if name != "DefaultStrategy"
+    }
+    at = AppTest.from_function(app)
+    at.run()
+    assert not at.exception
+    after = {
+        name: value
+        for name, value in vars(PagesManager).items()
+        if name != "DefaultStrategy"
+    }
+    assert after == before
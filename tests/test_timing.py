@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from streamlit.testing.v1 import AppTest
+
+from streamlit_navigation_bar import disable_timing, enable_timing, timing_stats
+
+STAGES = {
+    "st_navbar",
+    "validate",
+    "validate_spec",
+    "prepare",
+    "register",
+    "component",
+    "adjust_css",
+    "navigation",
+}
+
+
+def app():
+    from streamlit_navigation_bar import st_navbar
+
+    st_navbar(["Home", "Reports"], key="nav")
+
+
+def test_stages_are_timed_when_enabled():
+    timing_stats(reset=True)
+    records = []
+    enable_timing(sink=lambda name, seconds: records.append(name))
+    try:
+        at = AppTest.from_function(app)
+        at.run()
+        at.run()
+        assert not at.exception
+    finally:
+        disable_timing()
+
+    stats = timing_stats(reset=True)
+    assert set(stats) == STAGES
+    # Each stage is timed once per run.
+    assert stats["st_navbar"].count == 2
+    assert stats["validate"].count == 2
+    # The navbar is only prepared on the first run of the session.
+    assert stats["validate_spec"].count == 1
+    assert stats["prepare"].count == 1
+    for stage_stats in stats.values():
+        assert 0 < stage_stats.p50 <= stage_stats.p99 <= stage_stats.max
+    assert sorted(records) == sorted(
+        name for name, stage_stats in stats.items() for _ in range(stage_stats.count)
+    )
+
+
+def test_nothing_is_timed_when_disabled():
+    timing_stats(reset=True)
+    at = AppTest.from_function(app)
+    at.run()
+    assert not at.exception
+    assert timing_stats() == {}